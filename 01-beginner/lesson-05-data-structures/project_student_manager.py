@@ -15,6 +15,7 @@ from datetime import datetime
 
 students_db = {}  # Dictionary of student records
 course_list = ["Math", "Science", "English", "History", "Art"]
+name_trie = {}  # Prefix tree of lowercase names: one nested dict per character
 
 
 # ============================================
@@ -39,15 +40,26 @@ def add_student(student_id, name, age, grade_level):
     
     students_db[student_id] = {
         "name": name,
+        "_name_lc": name.lower(),  # cached for case-insensitive search
         "age": age,
         "grade_level": grade_level,
         "grades": {course: [] for course in course_list},
         "attendance": [],
         "registration_date": datetime.now().strftime("%Y-%m-%d")
     }
+    _add_to_name_trie(name, student_id)
     return True
 
 
+def _add_to_name_trie(name, student_id):
+    """Index a student's name in the prefix tree used for autocomplete."""
+    node = name_trie
+    for char in name.lower():
+        node = node.setdefault(char, {})
+    # "ids" can't clash with the single-character keys
+    node.setdefault("ids", []).append(student_id)
+
+
 def add_grade(student_id, course, grade):
     """
     Add a grade for a student in a specific course.
@@ -70,6 +82,25 @@ def add_grade(student_id, course, grade):
     return True
 
 
+def add_grades_bulk(student_id, course, grade_list):
+    """
+    Add several grades for a student in a course with a single list extend.
+    
+    Args:
+        student_id (str): Student identifier
+        course (str): Course name
+        grade_list (list): Grade values (0-100)
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if student_id not in students_db:
+        return False
+    
+    students_db[student_id]["grades"].setdefault(course, []).extend(grade_list)
+    return True
+
+
 def calculate_average(grades_list):
     """Calculate average from a list of grades."""
     if not grades_list:
@@ -180,18 +211,45 @@ def search_students(query, search_by="name"):
     Returns:
         list: List of matching student IDs
     """
-    results = []
     query_lower = query.lower()
     
-    for student_id, student in students_db.items():
-        if search_by == "name":
-            if query_lower in student["name"].lower():
-                results.append(student_id)
-        elif search_by == "id":
-            if query_lower in student_id.lower():
-                results.append(student_id)
+    if search_by == "name":
+        return [student_id for student_id, student in students_db.items()
+                if query_lower in student["_name_lc"]]
+    elif search_by == "id":
+        return [student_id for student_id in students_db
+                if query_lower in student_id.lower()]
+    
+    return []
+
+
+def search_students_prefix(prefix):
+    """
+    Find students whose name starts with the given prefix.
+    
+    Walks the name trie instead of scanning every student, so the cost
+    depends on the prefix length and the number of matches.
+    
+    Returns:
+        list: Sorted list of matching student IDs
+    """
+    node = name_trie
+    for char in prefix.lower():
+        node = node.get(char)
+        if node is None:
+            return []
     
-    return results
+    results = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        for key, child in current.items():
+            if key == "ids":
+                results.extend(child)
+            else:
+                stack.append(child)
+    
+    return sorted(results)
 
 
 # ============================================
@@ -360,10 +418,10 @@ def add_grades_interactive():
     
     grade_input = get_input("Grade (0-100): ", float)
     
-    if grade_input is not None and isinstance(grade_input, (int, float)) and 0 <= grade_input <= 100:
-        grade = float(grade_input)
-        if add_grade(student_id, course, grade):
-            print(f"✅ Grade {grade} added for {course}!")
+    # get_input already converted the value to float (or re-prompted)
+    if grade_input is not None and 0.0 <= grade_input <= 100.0:
+        if add_grade(student_id, course, grade_input):
+            print(f"✅ Grade {grade_input} added for {course}!")
         else:
             print("❌ Failed to add grade!")
     else:
@@ -400,13 +458,17 @@ def load_sample_data():
     for student_id, name, age, grade_level in sample_students:
         add_student(student_id, name, age, grade_level)
     
-    # Add sample grades
+    # Add sample grades: draw them all at once, then hand out 3 per course
     import random
+    grades_per_course = 3
+    all_grades = random.choices(range(70, 101),
+                                k=len(students_db) * len(course_list) * grades_per_course)
+    
+    position = 0
     for student_id in students_db:
         for course in course_list:
-            for _ in range(3):  # 3 grades per course
-                grade = random.randint(70, 100)
-                add_grade(student_id, course, grade)
+            add_grades_bulk(student_id, course, all_grades[position:position + grades_per_course])
+            position += grades_per_course
     
     print("✅ Sample data loaded successfully!")
 
@@ -3,6 +3,7 @@ Main Entry Point for Data Analysis and ML Pipeline
 This script orchestrates the entire pipeline from data ingestion to model deployment.
 """
 
+import logging
 import os
 import sys
 from datetime import datetime
@@ -16,6 +17,8 @@ from src.config import Config
 
 def main():
     """Main function to run the pipeline."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("=== Data Analysis and ML Pipeline ===")
     print(f"Start time: {datetime.now()}")
     
@@ -6,11 +6,14 @@ This module handles exploratory data analysis and statistical analysis.
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 from scipy import stats
 from typing import Dict, Any, List, Tuple
-import json
+from concurrent.futures import ThreadPoolExecutor
 import os
+import weakref
+from src.utils import safe_save_json
 
 
 class ExploratoryDataAnalyzer:
@@ -21,16 +24,47 @@ class ExploratoryDataAnalyzer:
         plt.style.use('seaborn-v0_8')
         sns.set_palette("husl")
 
-    def get_data_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Get comprehensive summary of the data."""
+    def _create_figure(self, figsize: Tuple[float, float], save_path: str = None, nrows: int = 1, ncols: int = 1):
+        """Create a figure and its axes.
+        
+        Figures that are only saved to disk are built without pyplot, so no
+        global figure state is shared and plots can be rendered from threads.
+        """
+        if save_path:
+            fig = Figure(figsize=figsize)
+            axes = fig.subplots(nrows, ncols)
+        else:
+            fig, axes = plt.subplots(nrows, ncols, figsize=figsize)
+        return fig, axes
+
+    def _finish_figure(self, fig, save_path: str = None):
+        """Save the figure to ``save_path`` or show it interactively."""
+        if save_path:
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
+        else:
+            plt.show()
+            plt.close(fig)
+
+    def get_data_summary(self, df: pd.DataFrame, deep_memory: bool = False) -> Dict[str, Any]:
+        """Get comprehensive summary of the data.
+        
+        Memory usage is estimated from dtype sizes unless ``deep_memory`` is
+        set, which also measures the Python objects held in object columns.
+        """
+        null_counts = df.isnull().sum()
+        missing_percentage = null_counts / len(df) * 100
+        
         summary = {
             "shape": df.shape,
             "columns": df.columns.tolist(),
             "data_types": df.dtypes.to_dict(),
-            "missing_values": df.isnull().sum().to_dict(),
-            "missing_percentage": (df.isnull().sum() / len(df) * 100).to_dict(),
+            "missing_values": null_counts.to_dict(),
+            "missing_percentage": missing_percentage.to_dict(),
+            # Scalar totals so reports don't have to re-sum the per-column dicts
+            "total_missing": int(null_counts.sum()),
+            "avg_missing_pct": float(missing_percentage.mean()) if len(missing_percentage) else 0.0,
             "duplicate_rows": df.duplicated().sum(),
-            "memory_usage": df.memory_usage(deep=True).sum()
+            "memory_usage": df.memory_usage(deep=deep_memory).sum()
         }
         
         # Numerical columns summary
@@ -60,7 +94,7 @@ class ExploratoryDataAnalyzer:
             return
         
         n_rows = (n_cols + 2) // 3
-        fig, axes = plt.subplots(n_rows, min(3, n_cols), figsize=(15, 5 * n_rows))
+        fig, axes = self._create_figure((15, 5 * n_rows), save_path, n_rows, min(3, n_cols))
         axes = axes.flatten() if n_cols > 1 else [axes]
         
         for i, col in enumerate(columns):
@@ -82,14 +116,8 @@ class ExploratoryDataAnalyzer:
         for i in range(n_cols, len(axes)):
             axes[i].set_visible(False)
         
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-        
-        plt.close()
+        fig.tight_layout()
+        self._finish_figure(fig, save_path)
 
     def plot_correlation_matrix(self, df: pd.DataFrame, save_path: str = None):
         """Plot correlation matrix."""
@@ -99,17 +127,12 @@ class ExploratoryDataAnalyzer:
         
         corr_matrix = numerical_df.corr()
         
-        plt.figure(figsize=(12, 10))
+        fig, ax = self._create_figure((12, 10), save_path)
         sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0, 
-                    square=True, linewidths=0.5, cbar_kws={"shrink": .8})
-        plt.title('Correlation Matrix')
+                    square=True, linewidths=0.5, cbar_kws={"shrink": .8}, ax=ax)
+        ax.set_title('Correlation Matrix')
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-        
-        plt.close()
+        self._finish_figure(fig, save_path)
 
     def plot_categorical_distributions(self, df: pd.DataFrame, columns: List[str] = None, save_path: str = None):
         """Plot distributions of categorical columns."""
@@ -121,7 +144,7 @@ class ExploratoryDataAnalyzer:
             return
         
         n_rows = (n_cols + 1) // 2
-        fig, axes = plt.subplots(n_rows, min(2, n_cols), figsize=(15, 6 * n_rows))
+        fig, axes = self._create_figure((15, 6 * n_rows), save_path, n_rows, min(2, n_cols))
         axes = axes.flatten() if n_cols > 1 else [axes]
         
         for i, col in enumerate(columns):
@@ -140,21 +163,44 @@ class ExploratoryDataAnalyzer:
         for i in range(n_cols, len(axes)):
             axes[i].set_visible(False)
         
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        else:
-            plt.show()
-        
-        plt.close()
+        fig.tight_layout()
+        self._finish_figure(fig, save_path)
 
 
 class StatisticalAnalyzer:
     """Performs statistical analysis."""
 
     def __init__(self):
-        pass
+        # id(df) -> (weak reference to df, {column: NaN-free values}); an
+        # entry is dropped as soon as its frame is garbage collected
+        self._col_cache: Dict[int, Tuple[weakref.ref, Dict[str, np.ndarray]]] = {}
+
+    def _column_values(self, df: pd.DataFrame, column: str) -> np.ndarray:
+        """Return the non-null values of a column, reusing earlier conversions.
+        
+        Frames are assumed not to be modified between calls; use clear_cache()
+        after changing a frame in place.
+        """
+        key = id(df)
+        entry = self._col_cache.get(key)
+        if entry is None or entry[0]() is not df:
+            cache = self._col_cache  # Not self, so the callback keeps no analyzer alive
+            
+            def evict(ref, key=key):
+                if cache.get(key, (None,))[0] is ref:
+                    del cache[key]
+            
+            entry = self._col_cache[key] = (weakref.ref(df, evict), {})
+        
+        columns = entry[1]
+        values = columns.get(column)
+        if values is None:
+            values = columns[column] = df[column].dropna().to_numpy()
+        return values
+
+    def clear_cache(self):
+        """Forget cached column values."""
+        self._col_cache.clear()
 
     def normality_test(self, df: pd.DataFrame, columns: List[str] = None) -> Dict[str, Dict[str, float]]:
         """Perform normality tests on numerical columns."""
@@ -206,8 +252,8 @@ class StatisticalAnalyzer:
         if column1 not in df.columns or column2 not in df.columns:
             raise ValueError("One or both columns not found in dataframe")
         
-        data1 = df[column1].dropna()
-        data2 = df[column2].dropna()
+        data1 = self._column_values(df, column1)
+        data2 = self._column_values(df, column2)
         
         if test_type == 'ttest':
             stat, p_value = stats.ttest_ind(data1, data2)
@@ -245,17 +291,17 @@ class ReportGenerator:
                 "memory_usage_mb": eda_results["memory_usage"] / 1024 / 1024
             },
             "data_quality": {
-                "missing_values": sum(eda_results["missing_values"].values()),
+                "missing_values": eda_results["total_missing"],
                 "duplicate_rows": eda_results["duplicate_rows"],
-                "completeness": 100 - (sum(eda_results["missing_percentage"].values()) / len(eda_results["missing_percentage"]) if eda_results["missing_percentage"] else 0)
+                "completeness": 100 - eda_results["avg_missing_pct"]
             },
             "columns": eda_results["columns"],
             "data_types": eda_results["data_types"],
             "normality_tests": stat_results.get("normality", {})
         }
         
-        with open(save_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if not safe_save_json(report, save_path):
+            raise OSError(f"Could not write report to {save_path}")
         
         return save_path
 
@@ -266,24 +312,20 @@ class ReportGenerator:
         os.makedirs(save_dir, exist_ok=True)
         
         eda = ExploratoryDataAnalyzer()
-        saved_files = []
-        
-        # Distribution plots
-        dist_path = os.path.join(save_dir, "distributions.png")
-        eda.plot_distributions(df, save_path=dist_path)
-        saved_files.append(dist_path)
-        
-        # Correlation matrix
-        corr_path = os.path.join(save_dir, "correlation_matrix.png")
-        eda.plot_correlation_matrix(df, save_path=corr_path)
-        saved_files.append(corr_path)
-        
-        # Categorical distributions
-        cat_path = os.path.join(save_dir, "categorical_distributions.png")
-        eda.plot_categorical_distributions(df, save_path=cat_path)
-        saved_files.append(cat_path)
-        
-        return saved_files
+        plots = [
+            (eda.plot_distributions, os.path.join(save_dir, "distributions.png")),
+            (eda.plot_correlation_matrix, os.path.join(save_dir, "correlation_matrix.png")),
+            (eda.plot_categorical_distributions, os.path.join(save_dir, "categorical_distributions.png"))
+        ]
+        
+        # The plots are independent and each renders into its own Figure,
+        # so they can be drawn and encoded concurrently
+        with ThreadPoolExecutor(max_workers=len(plots)) as executor:
+            futures = [executor.submit(plot, df, save_path=path) for plot, path in plots]
+            for future in futures:
+                future.result()
+        
+        return [path for _, path in plots]
 
 
 # Convenience functions
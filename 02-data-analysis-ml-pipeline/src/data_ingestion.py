@@ -5,12 +5,31 @@ This module handles loading data from various sources.
 
 import os
 import pandas as pd
+import numpy as np
 import json
 import sqlite3
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Iterator
 import requests
+from requests.adapters import HTTPAdapter
 from abc import ABC, abstractmethod
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib decoder
+    orjson = None
+
+try:
+    import connectorx
+except ImportError:  # optional: fall back to the sqlite3 cursor
+    connectorx = None
+
+try:
+    import pyarrow  # noqa: F401 - enables pandas' multithreaded Arrow parsers
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 
 class DataSource(ABC):
     """Abstract base class for data sources."""
@@ -26,19 +45,43 @@ class DataSource(ABC):
 
 
 class CSVDataSource(DataSource):
-    """CSV data source."""
+    """CSV data source.
+    
+    Uses the multithreaded PyArrow parser when pyarrow is installed; set
+    ``engine`` in the config to force a specific pandas parser.
+    """
 
-    def load_data(self) -> pd.DataFrame:
-        """Load data from CSV file."""
+    def _get_path(self) -> str:
+        """Return the configured file path, checking that it exists."""
         file_path = self.config.get("path")
         if not file_path or not os.path.exists(file_path):
             raise FileNotFoundError(f"CSV file not found: {file_path}")
+        return file_path
+
+    def load_data(self) -> pd.DataFrame:
+        """Load data from CSV file."""
+        file_path = self._get_path()
+        engine = self.config.get("engine", "pyarrow" if HAS_PYARROW else "c")
+        
+        return pd.read_csv(file_path, engine=engine)
+
+    def iter_chunks(self, chunksize: int = None) -> Iterator[pd.DataFrame]:
+        """Yield the CSV file in chunks of ``chunksize`` rows."""
+        file_path = self._get_path()
+        chunksize = chunksize or self.config.get("chunksize", 100_000)
         
-        return pd.read_csv(file_path)
+        with pd.read_csv(file_path, chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield chunk
 
 
 class JSONDataSource(DataSource):
-    """JSON data source."""
+    """JSON data source.
+    
+    Newline-delimited files (``lines`` in the config, or a ``.jsonl`` path) are
+    parsed by pandas, using the PyArrow engine when pyarrow is installed.
+    Regular JSON documents are decoded with orjson when available.
+    """
 
     def load_data(self) -> pd.DataFrame:
         """Load data from JSON file."""
@@ -46,8 +89,16 @@ class JSONDataSource(DataSource):
         if not file_path or not os.path.exists(file_path):
             raise FileNotFoundError(f"JSON file not found: {file_path}")
         
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        if self.config.get("lines", file_path.endswith(".jsonl")):
+            engine = self.config.get("engine", "pyarrow" if HAS_PYARROW else "ujson")
+            return pd.read_json(file_path, lines=True, engine=engine)
+        
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r') as f:
+                data = json.load(f)
         
         return pd.DataFrame(data)
 
@@ -66,28 +117,59 @@ class SQLDataSource(DataSource):
         if not query:
             raise ValueError("SQL query not provided")
         
+        if connectorx is not None:
+            # Native reader that builds columns directly, without Python rows
+            return connectorx.read_sql(f"sqlite://{os.path.abspath(db_path)}", query, return_type="pandas")
+        
+        chunksize = self.config.get("chunksize", 100_000)
         conn = sqlite3.connect(db_path)
         try:
-            df = pd.read_sql_query(query, conn)
+            cursor = conn.execute(query)
+            columns = [description[0] for description in cursor.description]
+            
+            # Fetch in batches so only one batch of row tuples is alive at a time
+            chunks = []
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                chunks.append(pd.DataFrame.from_records(rows, columns=columns, coerce_float=True))
         finally:
             conn.close()
         
-        return df
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, ignore_index=True)
+
+
+def _create_http_session() -> requests.Session:
+    """Create a session whose connection pool is shared by all API sources."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 class APIDataSource(DataSource):
     """API data source."""
 
+    # Shared across instances so repeated loads reuse open connections
+    _session = _create_http_session()
+
     def load_data(self) -> pd.DataFrame:
         """Load data from API."""
         url = self.config.get("url")
         if not url:
             raise ValueError("API URL not provided")
         
-        response = requests.get(url)
+        timeout = self.config.get("timeout", (5, 60))
+        response = self._session.get(url, timeout=timeout)
         response.raise_for_status()
         
-        data = response.json()
+        data = orjson.loads(response.content) if orjson is not None else response.json()
         return pd.DataFrame(data)
 
 
@@ -127,13 +209,25 @@ class DataIngestionManager:
         return self.data_sources[source_name].load_data()
 
     def load_all_data(self) -> Dict[str, pd.DataFrame]:
-        """Load data from all sources."""
+        """Load data from all sources.
+        
+        Sources are I/O-bound, so they are loaded concurrently on a thread
+        pool. Results keep the order in which the sources were added.
+        """
         data = {}
-        for name, source in self.data_sources.items():
-            try:
-                data[name] = source.load_data()
-            except Exception as e:
-                print(f"Warning: Failed to load data from {name}: {e}")
+        if not self.data_sources:
+            return data
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(self.data_sources))) as executor:
+            futures = {
+                name: executor.submit(source.load_data)
+                for name, source in self.data_sources.items()
+            }
+            for name, future in futures.items():
+                try:
+                    data[name] = future.result()
+                except Exception as e:
+                    print(f"Warning: Failed to load data from {name}: {e}")
         return data
 
     def combine_data(self, sources: List[str] = None) -> pd.DataFrame:
@@ -141,17 +235,34 @@ class DataIngestionManager:
         if sources is None:
             sources = list(self.data_sources.keys())
         
-        dfs = []
-        for source_name in sources:
-            if source_name in self.data_sources:
-                df = self.load_data(source_name)
-                df['source'] = source_name  # Add source identifier
-                dfs.append(df)
+        names = [name for name in sources if name in self.data_sources]
+        dfs = [self.load_data(name) for name in names]
         
         if not dfs:
             return pd.DataFrame()
         
-        return pd.concat(dfs, ignore_index=True)
+        first = dfs[0]
+        dtypes = set(first.dtypes)
+        dtype = dtypes.pop() if len(dtypes) == 1 else None
+        # Only plain NumPy numeric dtypes survive to_numpy() unchanged; extension
+        # dtypes (nullable Int64, boolean, ...) need pd.concat to keep their type
+        fast_path = (isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+                     and all(df.columns.equals(first.columns) and set(df.dtypes) == {dtype}
+                             for df in dfs[1:]))
+        if fast_path:
+            # Homogeneous numeric frames: stack the raw blocks in one call
+            combined = pd.DataFrame(np.concatenate([df.to_numpy() for df in dfs]), columns=first.columns)
+        else:
+            combined = pd.concat(dfs, ignore_index=True)
+        
+        # Add source identifier as a categorical built from per-source codes;
+        # a source listed twice maps to the same category
+        categories = list(dict.fromkeys(names))
+        source_codes = np.array([categories.index(name) for name in names], dtype=np.int32)
+        codes = np.repeat(source_codes, [len(df) for df in dfs])
+        combined['source'] = pd.Categorical.from_codes(codes, categories=categories)
+        
+        return combined
 
 
 # Convenience functions
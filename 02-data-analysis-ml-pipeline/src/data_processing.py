@@ -5,9 +5,10 @@ This module handles data cleaning, transformation, and feature engineering.
 
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler, MinMaxScaler, LabelEncoder
+from sklearn.preprocessing import StandardScaler, MinMaxScaler
+from sklearn.feature_extraction import FeatureHasher
 from sklearn.impute import SimpleImputer
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Callable, List, Tuple
 import re
 
 
@@ -28,23 +29,22 @@ class DataCleaner:
 
     def handle_missing_values(self, df: pd.DataFrame, strategy: str = "drop") -> pd.DataFrame:
         """Handle missing values."""
-        missing_count = df.isnull().sum().sum()
-        if missing_count == 0:
+        missing = df.isnull().to_numpy()
+        if not missing.any():
             return df
         
-        print(f"Found {missing_count} missing values")
+        print(f"Found {int(missing.sum())} missing values")
         
         if strategy == "drop":
             df = df.dropna()
-        elif strategy == "mean":
-            numeric_columns = df.select_dtypes(include=[np.number]).columns
-            df[numeric_columns] = df[numeric_columns].fillna(df[numeric_columns].mean())
-        elif strategy == "median":
-            numeric_columns = df.select_dtypes(include=[np.number]).columns
-            df[numeric_columns] = df[numeric_columns].fillna(df[numeric_columns].median())
+        elif strategy in ("mean", "median"):
+            numeric_df = df.select_dtypes(include=[np.number])
+            df = df.fillna(getattr(numeric_df, strategy)())
         elif strategy == "mode":
-            for column in df.columns:
-                df[column] = df[column].fillna(df[column].mode()[0] if not df[column].mode().empty else "Unknown")
+            # First mode of every column in one call; all-missing columns get "Unknown"
+            modes = df.mode()
+            fill_values = modes.iloc[0] if len(modes) else pd.Series(index=df.columns, dtype=object)
+            df = df.fillna(fill_values.astype(object).fillna("Unknown").to_dict())
         
         return df
 
@@ -53,22 +53,29 @@ class DataCleaner:
         if columns is None:
             columns = df.select_dtypes(include=[np.number]).columns.tolist()
         
+        columns = [column for column in columns if column in df.columns]
+        if not columns:
+            return df
+        
         initial_count = len(df)
         
-        for column in columns:
-            if column not in df.columns:
-                continue
-                
-            if method == "iqr":
-                Q1 = df[column].quantile(0.25)
-                Q3 = df[column].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                df = df[(df[column] >= lower_bound) & (df[column] <= upper_bound)]
-            elif method == "zscore":
-                z_scores = np.abs((df[column] - df[column].mean()) / df[column].std())
-                df = df[z_scores < 3]
+        # Bounds for every column are computed on the input frame, and rows are
+        # filtered once with a combined mask instead of once per column
+        values = df[columns].to_numpy(dtype=np.float64)
+        
+        if method == "iqr":
+            Q1, Q3 = np.nanpercentile(values, [25, 75], axis=0)
+            IQR = Q3 - Q1
+            lower_bound = Q1 - 1.5 * IQR
+            upper_bound = Q3 + 1.5 * IQR
+            mask = ((values >= lower_bound) & (values <= upper_bound)).all(axis=1)
+        elif method == "zscore":
+            z_scores = np.abs((values - np.nanmean(values, axis=0)) / np.nanstd(values, axis=0, ddof=1))
+            mask = (z_scores < 3).all(axis=1)
+        else:
+            return df
+        
+        df = df[mask]
         
         removed_count = initial_count - len(df)
         if removed_count > 0:
@@ -84,8 +91,12 @@ class DataTransformer:
         self.scalers = {}
         self.encoders = {}
 
-    def scale_features(self, df: pd.DataFrame, columns: List[str] = None, method: str = "standard") -> pd.DataFrame:
-        """Scale numerical features."""
+    def scale_features(self, df: pd.DataFrame, columns: List[str] = None, method: str = "standard",
+                       copy: bool = True) -> pd.DataFrame:
+        """Scale numerical features.
+        
+        With ``copy=False`` the columns are overwritten in ``df`` itself.
+        """
         if columns is None:
             columns = df.select_dtypes(include=[np.number]).columns.tolist()
         
@@ -96,7 +107,7 @@ class DataTransformer:
         else:
             raise ValueError(f"Unknown scaling method: {method}")
         
-        df_scaled = df.copy()
+        df_scaled = df.copy() if copy else df
         df_scaled[columns] = scaler.fit_transform(df[columns])
         
         # Store scaler for later use
@@ -104,29 +115,69 @@ class DataTransformer:
         
         return df_scaled
 
-    def encode_categorical(self, df: pd.DataFrame, columns: List[str] = None) -> pd.DataFrame:
-        """Encode categorical variables."""
+    def encode_categorical(self, df: pd.DataFrame, columns: List[str] = None,
+                           copy: bool = True) -> pd.DataFrame:
+        """Encode categorical variables as integer codes.
+        
+        Codes index into the sorted categories stored in ``self.encoders``;
+        missing values are encoded as -1. With ``copy=False`` the columns are
+        overwritten in ``df`` itself.
+        """
         if columns is None:
             columns = df.select_dtypes(include=['object']).columns.tolist()
         
-        df_encoded = df.copy()
+        df_encoded = df.copy() if copy else df
         
         for column in columns:
             if column not in df.columns:
                 continue
             
-            encoder = LabelEncoder()
-            df_encoded[column] = encoder.fit_transform(df[column].astype(str))
-            self.encoders[column] = encoder
+            categorical = pd.Categorical(df[column].astype("string"))
+            df_encoded[column] = categorical.codes.astype(np.int32, copy=False)
+            self.encoders[column] = categorical.categories
         
         return df_encoded
 
-    def create_dummy_variables(self, df: pd.DataFrame, columns: List[str] = None) -> pd.DataFrame:
-        """Create dummy variables for categorical features."""
+    def decode_categorical(self, column: str, codes) -> pd.Index:
+        """Map integer codes produced by encode_categorical back to labels."""
+        if column not in self.encoders:
+            raise ValueError(f"No encoder fitted for column: {column}")
+        
+        # from_codes decodes -1 (missing/unknown) as NaN rather than wrapping around
+        return pd.Index(pd.Categorical.from_codes(np.asarray(codes), categories=self.encoders[column]))
+
+    def create_dummy_variables(self, df: pd.DataFrame, columns: List[str] = None, method: str = "dummy",
+                               n_features: int = 1024, sparse: bool = False) -> pd.DataFrame:
+        """Create dummy variables for categorical features.
+        
+        ``method="hash"`` replaces the one-hot columns with ``n_features``
+        sparse hashed columns, whose width does not grow with cardinality.
+        """
         if columns is None:
             columns = df.select_dtypes(include=['object']).columns.tolist()
         
-        return pd.get_dummies(df, columns=columns, prefix=columns)
+        if method == "dummy":
+            return pd.get_dummies(df, columns=columns, prefix=columns, sparse=sparse, dtype=np.uint8)
+        elif method != "hash":
+            raise ValueError(f"Unknown dummy variable method: {method}")
+        
+        columns = [column for column in columns if column in df.columns]
+        if not columns:
+            return df.copy()
+        
+        # One "column=value" token per categorical column and row
+        tokens = pd.concat(
+            [column + "=" + df[column].astype("string").fillna("<NA>") for column in columns], axis=1
+        ).to_numpy().tolist()
+        
+        hasher = FeatureHasher(n_features=n_features, input_type="string")
+        matrix = hasher.transform(tokens).tocsc()
+        hashed = pd.DataFrame(
+            {f"hash_{i}": pd.arrays.SparseArray.from_spmatrix(matrix[:, i]) for i in range(n_features)},
+            index=df.index
+        )
+        
+        return pd.concat([df.drop(columns=columns), hashed], axis=1)
 
 
 class FeatureEngineer:
@@ -135,30 +186,46 @@ class FeatureEngineer:
     def __init__(self):
         self.feature_operations = []
 
+    def _append_features(self, df: pd.DataFrame, values: np.ndarray, names: List[str]) -> pd.DataFrame:
+        """Append a block of new feature columns with a single concat."""
+        new_features = pd.DataFrame(values, columns=names, index=df.index)
+        existing = [name for name in names if name in df.columns]
+        if existing:
+            df = df.drop(columns=existing)
+        return pd.concat([df, new_features], axis=1)
+
     def create_polynomial_features(self, df: pd.DataFrame, columns: List[str], degree: int = 2) -> pd.DataFrame:
         """Create polynomial features."""
-        df_poly = df.copy()
+        columns = [column for column in columns if column in df.columns]
+        if not columns or degree < 2:
+            return df.copy()
         
-        for column in columns:
-            if column not in df.columns:
-                continue
-            
-            for i in range(2, degree + 1):
-                df_poly[f"{column}^{i}"] = df[column] ** i
+        # Build every power in one preallocated block, laid out as
+        # col1^2 .. col1^degree, col2^2 .. col2^degree, ...
+        X = df[columns].to_numpy()
+        n_powers = degree - 1
+        powers = np.empty((X.shape[0], len(columns) * n_powers), dtype=X.dtype)
+        current = X.copy()
+        for i in range(2, degree + 1):
+            np.multiply(current, X, out=current)
+            powers[:, i - 2::n_powers] = current
         
-        return df_poly
+        names = [f"{column}^{i}" for column in columns for i in range(2, degree + 1)]
+        return self._append_features(df, powers, names)
 
     def create_interaction_features(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
         """Create interaction features."""
-        df_interact = df.copy()
+        columns = [column for column in columns if column in df.columns]
+        if len(columns) < 2:
+            return df.copy()
         
-        for i in range(len(columns)):
-            for j in range(i + 1, len(columns)):
-                col1, col2 = columns[i], columns[j]
-                if col1 in df.columns and col2 in df.columns:
-                    df_interact[f"{col1}*{col2}"] = df[col1] * df[col2]
+        # All pairwise products in one vectorized multiply
+        X = df[columns].to_numpy()
+        left, right = np.triu_indices(len(columns), k=1)
+        products = X[:, left] * X[:, right]
         
-        return df_interact
+        names = [f"{columns[i]}*{columns[j]}" for i, j in zip(left, right)]
+        return self._append_features(df, products, names)
 
     def create_binned_features(self, df: pd.DataFrame, column: str, bins: int = 5) -> pd.DataFrame:
         """Create binned features."""
@@ -178,13 +245,30 @@ class FeatureEngineer:
         df_dt = df.copy()
         df_dt[column] = pd.to_datetime(df[column])
         
-        df_dt[f"{column}_year"] = df_dt[column].dt.year
-        df_dt[f"{column}_month"] = df_dt[column].dt.month
-        df_dt[f"{column}_day"] = df_dt[column].dt.day
-        df_dt[f"{column}_weekday"] = df_dt[column].dt.weekday
-        df_dt[f"{column}_hour"] = df_dt[column].dt.hour
+        # Derive every field from one datetime64 buffer with calendar unit
+        # casts instead of five separate .dt accessor passes
+        timestamps = df_dt[column]
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_localize(None)  # local wall-clock time
+        values = timestamps.to_numpy(dtype="datetime64[ns]")
+        
+        days = values.astype("datetime64[D]")
+        month_starts = values.astype("datetime64[M]")
+        fields = {
+            "year": values.astype("datetime64[Y]").astype(np.int64) + 1970,
+            "month": month_starts.astype(np.int64) % 12 + 1,
+            "day": (days - month_starts.astype("datetime64[D]")).astype(np.int64) + 1,
+            "weekday": (days.astype(np.int64) + 3) % 7,  # 1970-01-01 was a Thursday
+            "hour": (values - days).astype("timedelta64[h]").astype(np.int64)
+        }
         
-        return df_dt
+        missing = np.isnat(values)
+        if missing.any():
+            fields = {name: np.where(missing, np.nan, field) for name, field in fields.items()}
+        else:
+            fields = {name: field.astype(np.int32) for name, field in fields.items()}
+        
+        return df_dt.assign(**{f"{column}_{name}": field for name, field in fields.items()})
 
 
 class DataProcessor:
@@ -194,10 +278,17 @@ class DataProcessor:
         self.cleaner = DataCleaner()
         self.transformer = DataTransformer()
         self.engineer = FeatureEngineer()
+        self._row_plan = None
 
     def process_data(self, df: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
-        """Process data according to configuration."""
-        df_processed = df.copy()
+        """Process data according to configuration.
+        
+        The input is copied once up front (skipped when ``config["inplace"]``
+        is set) and later steps work on that copy without copying again.
+        """
+        df_processed = df if config.get("inplace", False) else df.copy()
+        plan = {"columns": df_processed.columns.tolist(), "scaler": None, "scaled_columns": [],
+                "encoding": "none", "steps": []}
         
         # Data cleaning
         cleaning_config = config.get("cleaning", {})
@@ -212,13 +303,21 @@ class DataProcessor:
         transform_config = config.get("transformation", {})
         scaling_method = transform_config.get("scaling", "none")
         if scaling_method != "none":
-            df_processed = self.transformer.scale_features(df_processed, method=scaling_method)
+            scaled_columns = df_processed.select_dtypes(include=[np.number]).columns.tolist()
+            df_processed = self.transformer.scale_features(df_processed, scaled_columns, method=scaling_method,
+                                                           copy=False)
+            plan["scaler"] = self.transformer.scalers[scaling_method]
+            plan["scaled_columns"] = scaled_columns
         
         encoding_method = transform_config.get("encoding", "none")
+        plan["encoding"] = encoding_method
         if encoding_method == "label":
-            df_processed = self.transformer.encode_categorical(df_processed)
+            df_processed = self.transformer.encode_categorical(df_processed, copy=False)
         elif encoding_method == "dummy":
             df_processed = self.transformer.create_dummy_variables(df_processed)
+        elif encoding_method == "hash":
+            n_features = transform_config.get("hash_features", 1024)
+            df_processed = self.transformer.create_dummy_variables(df_processed, method="hash", n_features=n_features)
         
         # Feature engineering
         feature_config = config.get("feature_engineering", {})
@@ -226,13 +325,104 @@ class DataProcessor:
             poly_columns = feature_config.get("polynomial_columns", [])
             poly_degree = feature_config.get("polynomial_degree", 2)
             df_processed = self.engineer.create_polynomial_features(df_processed, poly_columns, poly_degree)
+            plan["steps"].append(("polynomial", poly_columns, poly_degree))
         
         if feature_config.get("interactions", False):
             interaction_columns = feature_config.get("interaction_columns", [])
             df_processed = self.engineer.create_interaction_features(df_processed, interaction_columns)
+            plan["steps"].append(("interactions", interaction_columns, None))
         
+        self._row_plan = plan
         return df_processed
 
+    def compile(self) -> Callable[[np.ndarray], np.ndarray]:
+        """Compile the last ``process_data`` run into a pandas-free row transform.
+        
+        The returned function takes raw values in the column order of the frame
+        given to ``process_data`` (one row, or a 2D batch) and returns float32
+        features in the column order of the processed frame. Label-encoded
+        columns must already hold their integer codes, and rows are assumed to
+        have no missing values.
+        
+        Raises:
+            ValueError: If ``process_data`` has not been run or used dummy or
+                hashed encoding, whose output columns depend on the data.
+        """
+        plan = self._row_plan
+        if plan is None:
+            raise ValueError("process_data must be run before compile")
+        if plan["encoding"] in ("dummy", "hash"):
+            raise ValueError(f"Cannot compile a pipeline with '{plan['encoding']}' encoding")
+        
+        # Scaling folded into one affine map: x * scale + offset
+        columns = plan["columns"]
+        n_inputs = len(columns)
+        scale = np.ones(n_inputs, dtype=np.float32)
+        offset = np.zeros(n_inputs, dtype=np.float32)
+        scaler = plan["scaler"]
+        if scaler is not None:
+            index = [columns.index(column) for column in plan["scaled_columns"]]
+            if isinstance(scaler, StandardScaler):
+                scale[index] = 1 / scaler.scale_
+                offset[index] = -scaler.mean_ / scaler.scale_
+            else:
+                scale[index] = scaler.scale_
+                offset[index] = scaler.min_
+        
+        # Every feature gets a slot in a work buffer; each level of products
+        # only reads slots filled by earlier levels, so it is one vectorized
+        # multiply. Mirrors FeatureEngineer, including replacing columns that
+        # are generated again.
+        slots = {column: i for i, column in enumerate(columns)}
+        order = list(columns)
+        levels = []
+        n_slots = n_inputs
+        
+        def add_level(left, right):
+            nonlocal n_slots
+            dest = np.arange(n_slots, n_slots + len(left))
+            n_slots += len(left)
+            levels.append((dest, np.asarray(left), np.asarray(right)))
+            return dest
+        
+        for kind, step_columns, degree in plan["steps"]:
+            present = [column for column in step_columns if column in slots]
+            base = [slots[column] for column in present]
+            new_slots = {}
+            if kind == "polynomial" and present and degree >= 2:
+                previous = base
+                for power in range(2, degree + 1):
+                    previous = add_level(previous, base)
+                    new_slots.update((f"{column}^{power}", slot) for column, slot in zip(present, previous))
+                # Same layout as create_polynomial_features: per column, by power
+                new_slots = {f"{column}^{power}": new_slots[f"{column}^{power}"]
+                             for column in present for power in range(2, degree + 1)}
+            elif kind == "interactions" and len(present) > 1:
+                left, right = np.triu_indices(len(present), k=1)
+                dest = add_level(np.take(base, left), np.take(base, right))
+                new_slots = {f"{present[i]}*{present[j]}": slot for i, j, slot in zip(left, right, dest)}
+            
+            for name, slot in new_slots.items():
+                if name in slots:
+                    order.remove(name)
+                order.append(name)
+                slots[name] = slot
+        
+        output = np.array([slots[name] for name in order])
+        
+        def transform(values: np.ndarray) -> np.ndarray:
+            values = np.asarray(values, dtype=np.float32)
+            rows = values.reshape(-1, n_inputs)
+            buffer = np.empty((rows.shape[0], n_slots), dtype=np.float32)
+            np.multiply(rows, scale, out=buffer[:, :n_inputs])
+            buffer[:, :n_inputs] += offset
+            for dest, left, right in levels:
+                buffer[:, dest] = buffer[:, left] * buffer[:, right]
+            result = buffer[:, output]
+            return result[0] if values.ndim == 1 else result
+        
+        return transform
+
     def get_feature_names(self, df: pd.DataFrame) -> List[str]:
         """Get feature names from processed dataframe."""
         return df.columns.tolist()
@@ -6,12 +6,32 @@ This module handles model deployment and API serving.
 import joblib
 import pandas as pd
 import numpy as np
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.views import MethodView
 import json
 import os
 from typing import Dict, Any, List, Optional
 import threading
 import time
+from collections import OrderedDict
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import waitress
+except ImportError:  # optional: fall back to the threaded Flask server
+    waitress = None
+
+try:
+    import onnxruntime as ort
+    from skl2onnx import to_onnx
+except ImportError:  # optional: serve with the sklearn model
+    ort = None
+    to_onnx = None
 
 
 class ModelServer:
@@ -21,6 +41,7 @@ class ModelServer:
         self.app = Flask(__name__)
         self.model = None
         self.model_metadata = {}
+        self.session = None
         
         # Load model if path provided
         if model_path and os.path.exists(model_path):
@@ -33,13 +54,42 @@ class ModelServer:
 
     def load_model(self, model_path: str):
         """Load a trained model."""
-        self.model = joblib.load(model_path)
+        self.model = _load_model(model_path)
         
         # Load metadata if available
         metadata_path = model_path.replace('.joblib', '_metadata.json')
         if os.path.exists(metadata_path):
             with open(metadata_path, 'r') as f:
                 self.model_metadata = json.load(f)
+        
+        # Prefer the ONNX export for inference if one was deployed alongside
+        onnx_path = model_path.replace('.joblib', '.onnx')
+        if ort is not None and os.path.exists(onnx_path):
+            options = ort.SessionOptions()
+            options.intra_op_num_threads = os.cpu_count() or 1
+            self.session = ort.InferenceSession(
+                onnx_path, sess_options=options, providers=["CPUExecutionProvider"]
+            )
+
+    def _feature_order(self) -> Optional[list]:
+        """Column names the loaded model expects, if they are known."""
+        names = getattr(self.model, "feature_names_in_", None)
+        if names is not None:
+            return list(names)
+        return self.model_metadata.get("feature_names") or None
+
+    def _predict(self, X) -> np.ndarray:
+        """Run inference through ONNX Runtime when available, else sklearn."""
+        if self.session is None:
+            return self.model.predict(X)
+        
+        if isinstance(X, pd.DataFrame):
+            feature_names = self.model_metadata.get("feature_names")
+            if feature_names:
+                X = X[feature_names]
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        input_name = self.session.get_inputs()[0].name
+        return self.session.run(None, {input_name: X})[0].ravel()
 
     def save_model(self, model_path: str):
         """Save the current model."""
@@ -62,53 +112,7 @@ class ModelServer:
                 "timestamp": time.time()
             })
 
-        @self.app.route('/predict', methods=['POST'])
-        def predict():
-            """Prediction endpoint."""
-            if not self.model:
-                return jsonify({"error": "No model loaded"}), 500
-            
-            try:
-                # Get input data
-                data = request.get_json()
-                
-                if not data:
-                    return jsonify({"error": "No input data provided"}), 400
-                
-                # Handle different input formats
-                if "features" in data:
-                    features = data["features"]
-                else:
-                    features = data
-                
-                # Convert to DataFrame
-                if isinstance(features, dict):
-                    # Single prediction
-                    df = pd.DataFrame([features])
-                elif isinstance(features, list):
-                    if isinstance(features[0], dict):
-                        # Multiple predictions
-                        df = pd.DataFrame(features)
-                    else:
-                        # Single prediction as list
-                        df = pd.DataFrame([features], columns=self.model_metadata.get("feature_names", []))
-                else:
-                    return jsonify({"error": "Invalid input format"}), 400
-                
-                # Make prediction
-                predictions = self.model.predict(df)
-                
-                # Format response
-                response = {
-                    "predictions": predictions.tolist(),
-                    "model": self.model_metadata.get("model_name", "unknown"),
-                    "timestamp": time.time()
-                }
-                
-                return jsonify(response)
-                
-            except Exception as e:
-                return jsonify({"error": str(e)}), 500
+        self.app.add_url_rule('/predict', view_func=PredictView.as_view('predict', self))
 
         @self.app.route('/model/info', methods=['GET'])
         def model_info():
@@ -124,9 +128,97 @@ class ModelServer:
             
             return jsonify(info)
 
-    def run(self, host: str = 'localhost', port: int = 5000, debug: bool = False):
-        """Run the API server."""
-        self.app.run(host=host, port=port, debug=debug)
+    def run(self, host: str = 'localhost', port: int = 5000, debug: bool = False,
+            threads: int = 8):
+        """Run the API server.
+        
+        Uses waitress' multithreaded WSGI server when it is installed; for
+        multi-process serving, point gunicorn at ``create_app()`` instead.
+        """
+        if waitress is not None and not debug:
+            waitress.serve(self.app, host=host, port=port, threads=threads)
+        else:
+            self.app.run(host=host, port=port, debug=debug, threaded=True)
+
+
+def _parse_features(data: Any, feature_names: Optional[list] = None):
+    """Validate a /predict payload and convert it to model input.
+    
+    Positional values are labelled with ``feature_names`` when given, so a
+    model fitted on a named DataFrame sees the same columns at predict time.
+    
+    Raises:
+        ValueError: If the payload is empty or not in a supported format.
+    """
+    if not data:
+        raise ValueError("No input data provided")
+    
+    # Handle different input formats
+    features = data.get("features", data) if isinstance(data, dict) else data
+    
+    if isinstance(features, dict):
+        # Single prediction
+        return pd.DataFrame([features])
+    if isinstance(features, list) and features:
+        if isinstance(features[0], dict):
+            # Multiple predictions
+            return pd.DataFrame(features)
+        # Positional values (one row or a batch)
+        X = np.asarray(features, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        return pd.DataFrame(X, columns=feature_names) if feature_names else X
+    raise ValueError("Invalid input format")
+
+
+class PredictView(MethodView):
+    """Prediction endpoint.
+    
+    One view instance serves every request, so dispatch does no per-request
+    setup beyond decoding the body.
+    """
+
+    init_every_request = False
+
+    def __init__(self, server: ModelServer):
+        self.server = server
+
+    def post(self):
+        server = self.server
+        if not server.model:
+            return jsonify({"error": "No model loaded"}), 500
+        
+        try:
+            body = request.get_data()
+            data = orjson.loads(body) if orjson is not None else json.loads(body)
+            X = _parse_features(data, server._feature_order())
+        except ValueError as e:  # includes JSON decode errors
+            return jsonify({"error": str(e)}), 400
+        
+        try:
+            # Make prediction
+            predictions = server._predict(X)
+            
+            # Format response
+            response = {
+                "predictions": predictions,
+                "model": server.model_metadata.get("model_name", "unknown"),
+                "timestamp": time.time()
+            }
+            
+            return _json_response(response)
+            
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """Build a JSON response, serializing numpy arrays without tolist()."""
+    if orjson is not None:
+        body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        return Response(body, mimetype="application/json")
+    payload = {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in payload.items()}
+    return jsonify(payload)
 
 
 class ModelDeployer:
@@ -145,6 +237,10 @@ class ModelDeployer:
         model_path = os.path.join(model_save_path, f"{model_name}.joblib")
         joblib.dump(model, model_path)
         
+        # Export an ONNX copy for faster serving
+        if to_onnx is not None and self.config.get("export_onnx", True):
+            self._export_onnx(model, model_path.replace('.joblib', '.onnx'), feature_names)
+        
         # Save metadata
         metadata = {
             "model_name": model_name,
@@ -165,41 +261,79 @@ class ModelDeployer:
         
         return model_path
 
+    def _export_onnx(self, model: Any, onnx_path: str, feature_names: List[str] = None):
+        """Convert a fitted sklearn model to ONNX; skipped if unsupported."""
+        n_features = len(feature_names) if feature_names else getattr(model, "n_features_in_", None)
+        if not n_features:
+            return
+        
+        try:
+            onnx_model = to_onnx(model, np.zeros((1, n_features), dtype=np.float32))
+        except Exception as e:
+            print(f"Warning: ONNX export skipped for {type(model).__name__}: {e}")
+            return
+        
+        with open(onnx_path, 'wb') as f:
+            f.write(onnx_model.SerializeToString())
+
     def create_api_server(self, model_path: str = None, model: Any = None) -> ModelServer:
         """Create an API server for a model."""
         return ModelServer(model_path, model)
 
 
 class PredictionCache:
-    """Caches predictions for performance."""
+    """Caches predictions for performance.
+    
+    Entries are kept in least-recently-used order, so lookups, inserts and
+    evictions are all O(1). Safe to share between server threads.
+    """
 
     def __init__(self, max_size: int = 1000):
-        self.cache = {}
+        self.cache = OrderedDict()
         self.max_size = max_size
-        self.access_times = {}
+        self._lock = threading.Lock()
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Any) -> Optional[Any]:
         """Get cached prediction."""
-        if key in self.cache:
-            self.access_times[key] = time.time()
-            return self.cache[key]
-        return None
+        # Fast negative lookup: a membership test is atomic, so misses skip
+        # the lock entirely
+        if key not in self.cache:
+            return None
+        
+        with self._lock:
+            value = self.cache.get(key)
+            if value is not None:
+                self.cache.move_to_end(key)
+            return value
 
-    def put(self, key: str, value: Any):
+    def put(self, key: Any, value: Any):
         """Cache a prediction."""
-        # Remove oldest entries if cache is full
-        if len(self.cache) >= self.max_size:
-            oldest_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
-            del self.cache[oldest_key]
-            del self.access_times[oldest_key]
-        
-        self.cache[key] = value
-        self.access_times[key] = time.time()
+        with self._lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            self.cache[key] = value
+            
+            # Remove least recently used entry if cache is full
+            if len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
 
     def clear(self):
         """Clear the cache."""
-        self.cache.clear()
-        self.access_times.clear()
+        with self._lock:
+            self.cache.clear()
+
+
+def create_app(model_path: str = None) -> Flask:
+    """WSGI application factory for production servers.
+    
+    Example:
+        MODEL_PATH=models/best.joblib gunicorn -w 4 -k gthread --threads 8 \\
+            --preload "src.deployment:create_app()"
+    
+    With ``--preload`` the model is loaded once before the workers fork.
+    """
+    model_path = model_path or os.environ.get("MODEL_PATH")
+    return ModelServer(model_path).app
 
 
 # Global model server instance
@@ -231,10 +365,67 @@ def start_api_server(model: Any = None, port: int = 5000, host: str = 'localhost
     return _model_server
 
 
+def _is_uncompressed_pickle(model_path: str) -> bool:
+    """Whether a joblib file is a plain pickle (compressed files never start with PROTO)."""
+    with open(model_path, 'rb') as f:
+        return f.read(1) == b'\x80'
+
+
+def _model_version(model_path: str) -> tuple:
+    """Identify the current contents of a model file by (mtime_ns, size)."""
+    st = os.stat(model_path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_model(model_path: str) -> Any:
+    """Load a saved model once and reuse it until the file changes.
+    
+    The cache is keyed on the file's modification time and size as well as
+    its path, so a model redeployed to the same path is picked up.
+    """
+    return _load_model_version(model_path, _model_version(model_path))
+
+
+@lru_cache(maxsize=8)
+def _load_model_version(model_path: str, version: tuple) -> Any:
+    """Load one version of a saved model.
+    
+    Arrays inside an uncompressed file, such as the ones ``deploy_model``
+    writes, are memory-mapped read-only, so worker processes serving the same
+    model share its pages instead of holding private copies. Compressed files
+    cannot be mapped and are loaded into memory.
+    """
+    mmap_mode = 'r' if _is_uncompressed_pickle(model_path) else None
+    return joblib.load(model_path, mmap_mode=mmap_mode)
+
+
+@lru_cache(maxsize=8)
+def _feature_order(model_path: str, version: tuple) -> Optional[tuple]:
+    """Resolve the column order a saved model version expects, if it is known."""
+    names = getattr(_load_model_version(model_path, version), "feature_names_in_", None)
+    if names is not None:
+        return tuple(names)
+    
+    metadata_path = model_path.replace('.joblib', '_metadata.json')
+    if os.path.exists(metadata_path):
+        with open(metadata_path, 'r') as f:
+            names = json.load(f).get("feature_names")
+    return tuple(names) if names else None
+
+
+def _features_key(features: Dict[str, Any]) -> bytes:
+    """Serialize features to canonical bytes for use as a cache key."""
+    if orjson is not None:
+        return orjson.dumps(features, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(features, sort_keys=True, default=str).encode()
+
+
 def make_prediction(model_path: str, features: Dict[str, Any]) -> List[float]:
     """Make a prediction using a saved model."""
-    # Create cache key
-    cache_key = f"{model_path}_{hash(str(features))}"
+    # Create cache key; the file version keeps redeployed models from
+    # serving predictions cached for the old one
+    version = _model_version(model_path)
+    cache_key = (model_path, version, _features_key(features))
     
     # Check cache first
     cached_result = _prediction_cache.get(cache_key)
@@ -242,9 +433,18 @@ def make_prediction(model_path: str, features: Dict[str, Any]) -> List[float]:
         return cached_result
     
     # Load model and make prediction
-    model = joblib.load(model_path)
-    df = pd.DataFrame([features])
-    predictions = model.predict(df).tolist()
+    model = _load_model_version(model_path, version)
+    feature_order = _feature_order(model_path, version)
+    if feature_order is not None:
+        X = np.fromiter((features[name] for name in feature_order),
+                        dtype=np.float64, count=len(feature_order)).reshape(1, -1)
+        if hasattr(model, "feature_names_in_"):
+            # Fitted on a named frame: label the row to avoid sklearn's
+            # missing-feature-names warning
+            X = pd.DataFrame(X, columns=feature_order, copy=False)
+    else:
+        X = pd.DataFrame([features])
+    predictions = model.predict(X).tolist()
     
     # Cache result
     _prediction_cache.put(cache_key, predictions)
@@ -5,45 +5,170 @@ This module handles model training, evaluation, and selection.
 
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
-from sklearn.linear_model import LinearRegression, LogisticRegression
-from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
-from sklearn.ensemble import GradientBoostingRegressor, GradientBoostingClassifier
-from sklearn.metrics import mean_squared_error, accuracy_score, classification_report, confusion_matrix
+from sklearn.model_selection import cross_val_score, GridSearchCV, KFold, StratifiedKFold
+from sklearn.metrics import accuracy_score, classification_report, confusion_matrix, get_scorer
 from sklearn.preprocessing import StandardScaler
 import joblib
+from joblib import Parallel, delayed
+from concurrent.futures import ThreadPoolExecutor
+import importlib
 import os
+import sys
 from typing import Dict, Any, List, Tuple, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import lz4
+except ImportError:  # optional: compress saved models with zlib instead
+    lz4 = None
+
+
+def _total_sum_of_squares(y_true: np.ndarray) -> float:
+    """Sum of squared deviations of y_true from its mean."""
+    centered = y_true - y_true.mean()
+    return float(centered @ centered)
+
+
+def _regression_metrics(y_true: np.ndarray, y_pred: np.ndarray,
+                        ss_tot: float = None) -> Tuple[float, float, float, float]:
+    """Compute (mse, rmse, mae, r2) from one residual vector.
+    
+    Sums of squares are dot products, so each pass is a single BLAS/ufunc
+    reduction over contiguous float64 data with no squared temporaries.
+    ``ss_tot`` depends only on y_true and can be passed in when several
+    models are scored against the same target.
+    """
+    if ss_tot is None:
+        ss_tot = _total_sum_of_squares(y_true)
+    residual = y_true - y_pred
+    
+    n = residual.shape[0]
+    ss_res = float(residual @ residual)
+    mse = ss_res / n
+    mae = float(np.abs(residual, out=residual).sum()) / n
+    if ss_tot == 0:
+        # Constant target: score like sklearn's r2_score (force_finite=True)
+        r2 = 1.0 if ss_res == 0 else 0.0
+    else:
+        r2 = 1 - ss_res / ss_tot
+    
+    return mse, float(np.sqrt(mse)), mae, r2
+
+
+def _confusion_accuracy(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[float, np.ndarray]:
+    """Compute accuracy and the confusion matrix in one counting pass.
+    
+    Labels are ordered like sklearn's confusion_matrix (sorted union of both
+    arrays); every (true, pred) pair is counted with a single bincount.
+    """
+    n = y_true.shape[0]
+    labels, codes = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+    n_labels = labels.shape[0]
+    
+    cm = np.bincount(codes[:n] * n_labels + codes[n:], minlength=n_labels * n_labels)
+    cm = cm.reshape(n_labels, n_labels)
+    
+    return float(np.trace(cm)) / n, cm
+
+
+def _stacked_linear_predictions(models: Dict[str, Any], X: Any) -> Dict[str, np.ndarray]:
+    """Predict every fitted linear model from one GEMM over stacked coefficients.
+    
+    Covers single-output LinearRegression and LogisticRegression; returns an
+    empty dict when there are fewer than two such models to batch.
+    """
+    # Estimators are imported lazily, so no linear model exists unless its
+    # module has been loaded
+    linear_model = sys.modules.get("sklearn.linear_model")
+    if linear_model is None:
+        return {}
+    LinearRegression, LogisticRegression = linear_model.LinearRegression, linear_model.LogisticRegression
+    
+    linear = {
+        name: model for name, model in models.items()
+        if isinstance(model, LogisticRegression)
+        or (isinstance(model, LinearRegression) and np.ndim(model.coef_) == 1)
+    }
+    if len(linear) < 2 or not isinstance(X, np.ndarray):
+        return {}
+    
+    weights = np.vstack([np.atleast_2d(model.coef_) for model in linear.values()])
+    intercepts = np.concatenate([
+        np.broadcast_to(model.intercept_, np.atleast_2d(model.coef_).shape[0]) for model in linear.values()
+    ])
+    scores = X @ weights.T + intercepts
+    
+    predictions = {}
+    start = 0
+    for name, model in linear.items():
+        width = np.atleast_2d(model.coef_).shape[0]
+        block = scores[:, start:start + width]
+        start += width
+        if isinstance(model, LinearRegression):
+            predictions[name] = block[:, 0]
+        elif width == 1:
+            predictions[name] = model.classes_[(block[:, 0] > 0).astype(np.intp)]
+        else:
+            predictions[name] = model.classes_[block.argmax(axis=1)]
+    
+    return predictions
+
 
 class ModelTrainer:
     """Handles model training and hyperparameter tuning."""
 
     def __init__(self):
         self.models = {}
+        self.model_specs = {}
+        self.task_kinds = {}
+        self.scorers = {
+            "classification": get_scorer("accuracy"),
+            "regression": get_scorer("neg_mean_squared_error")
+        }
         self._initialize_models()
 
     def _initialize_models(self):
-        """Initialize default models."""
+        """Register default models.
+        
+        Each entry names the estimator's module and class; the module is only
+        imported when the model is first used (see ``get_model``). The task
+        kind is tagged here so dispatch is a dict lookup, not attribute probing.
+        """
         # Regression models
-        self.models["linear_regression"] = LinearRegression()
-        self.models["random_forest_regressor"] = RandomForestRegressor(random_state=42)
-        self.models["gradient_boosting_regressor"] = GradientBoostingRegressor(random_state=42)
+        self.register_model("linear_regression", "sklearn.linear_model", "LinearRegression", "regression")
+        self.register_model("random_forest_regressor", "sklearn.ensemble", "RandomForestRegressor", "regression",
+                            random_state=42)
+        self.register_model("gradient_boosting_regressor", "sklearn.ensemble", "GradientBoostingRegressor",
+                            "regression", random_state=42)
         
         # Classification models
-        self.models["logistic_regression"] = LogisticRegression(random_state=42, max_iter=1000)
-        self.models["random_forest_classifier"] = RandomForestClassifier(random_state=42)
-        self.models["gradient_boosting_classifier"] = GradientBoostingClassifier(random_state=42)
+        self.register_model("logistic_regression", "sklearn.linear_model", "LogisticRegression", "classification",
+                            random_state=42, max_iter=1000)
+        self.register_model("random_forest_classifier", "sklearn.ensemble", "RandomForestClassifier",
+                            "classification", random_state=42)
+        self.register_model("gradient_boosting_classifier", "sklearn.ensemble", "GradientBoostingClassifier",
+                            "classification", random_state=42)
+
+    def register_model(self, model_name: str, module: str, class_name: str, task_kind: str, **params):
+        """Register an estimator to be imported and built on first use."""
+        self.model_specs[model_name] = (module, class_name, params)
+        self.task_kinds[model_name] = task_kind
+
+    def get_model(self, model_name: str) -> Any:
+        """Return the named model, importing and building it if needed."""
+        if model_name not in self.models:
+            if model_name not in self.model_specs:
+                raise ValueError(f"Unknown model: {model_name}")
+            module, class_name, params = self.model_specs[model_name]
+            estimator = getattr(importlib.import_module(module), class_name)
+            self.models[model_name] = estimator(**params)
+        return self.models[model_name]
 
     def train_model(self, X: pd.DataFrame, y: pd.Series, model_name: str, 
                    hyperparameters: Dict[str, Any] = None) -> Any:
         """Train a specific model."""
-        if model_name not in self.models:
-            raise ValueError(f"Unknown model: {model_name}")
-        
-        model = self.models[model_name]
+        model = self.get_model(model_name)
         
         # Set hyperparameters if provided
         if hyperparameters:
@@ -57,35 +182,38 @@ class ModelTrainer:
     def tune_hyperparameters(self, X: pd.DataFrame, y: pd.Series, model_name: str, 
                            param_grid: Dict[str, List[Any]], cv: int = 5) -> Tuple[Any, Dict[str, Any]]:
         """Tune hyperparameters using grid search."""
-        if model_name not in self.models:
-            raise ValueError(f"Unknown model: {model_name}")
+        model = self.get_model(model_name)
+        is_classifier = self.task_kinds[model_name] == "classification"
         
-        model = self.models[model_name]
+        # Materialize the folds once so every candidate reuses the same splits
+        splitter = StratifiedKFold if is_classifier else KFold
+        cv_splits = list(splitter(n_splits=cv, shuffle=True, random_state=42).split(X, y))
         
         # Perform grid search
-        grid_search = GridSearchCV(model, param_grid, cv=cv, n_jobs=-1, scoring='accuracy' if hasattr(model, 'predict_proba') else 'neg_mean_squared_error')
+        grid_search = GridSearchCV(model, param_grid, cv=cv_splits, n_jobs=-1, pre_dispatch="2*n_jobs",
+                                   scoring=self.scorers[self.task_kinds[model_name]])
         grid_search.fit(X, y)
         
         return grid_search.best_estimator_, grid_search.best_params_
 
     def cross_validate_model(self, X: pd.DataFrame, y: pd.Series, model_name: str, 
-                           cv: int = 5) -> Dict[str, float]:
-        """Perform cross-validation on a model."""
-        if model_name not in self.models:
-            raise ValueError(f"Unknown model: {model_name}")
+                           cv: int = 5) -> Dict[str, Any]:
+        """Perform cross-validation on a model.
         
-        model = self.models[model_name]
+        ``scores`` holds the per-fold scores as the ndarray returned by sklearn.
+        """
+        model = self.get_model(model_name)
         
         # Determine scoring metric
-        scoring = 'accuracy' if hasattr(model, 'predict_proba') else 'neg_mean_squared_error'
+        scoring = self.scorers[self.task_kinds[model_name]]
         
         # Perform cross-validation
         scores = cross_val_score(model, X, y, cv=cv, scoring=scoring, n_jobs=-1)
         
         return {
-            "mean_score": scores.mean(),
-            "std_score": scores.std(),
-            "scores": scores.tolist()
+            "mean_score": float(scores.mean()),
+            "std_score": float(scores.std()),
+            "scores": scores
         }
 
 
@@ -96,18 +224,19 @@ class ModelEvaluator:
         pass
 
     def evaluate_regression_model(self, model: Any, X_test: pd.DataFrame, 
-                                y_test: pd.Series) -> Dict[str, float]:
-        """Evaluate a regression model."""
-        y_pred = model.predict(X_test)
+                                y_test: pd.Series, y_pred: np.ndarray = None,
+                                ss_tot: float = None) -> Dict[str, float]:
+        """Evaluate a regression model.
         
-        mse = mean_squared_error(y_test, y_pred)
-        rmse = np.sqrt(mse)
-        mae = np.mean(np.abs(y_test - y_pred))
+        Pass ``y_pred`` to score predictions that were already computed, and
+        ``ss_tot`` to reuse the target's total sum of squares.
+        """
+        if y_pred is None:
+            y_pred = model.predict(X_test)
+        y_true = np.ascontiguousarray(np.asarray(y_test, dtype=np.float64))
+        y_pred = np.ascontiguousarray(y_pred, dtype=np.float64)
         
-        # R-squared
-        ss_res = np.sum((y_test - y_pred) ** 2)
-        ss_tot = np.sum((y_test - np.mean(y_test)) ** 2)
-        r2 = 1 - (ss_res / ss_tot)
+        mse, rmse, mae, r2 = _regression_metrics(y_true, y_pred, ss_tot)
         
         return {
             "mse": mse,
@@ -117,23 +246,35 @@ class ModelEvaluator:
         }
 
     def evaluate_classification_model(self, model: Any, X_test: pd.DataFrame, 
-                                    y_test: pd.Series) -> Dict[str, Any]:
-        """Evaluate a classification model."""
-        y_pred = model.predict(X_test)
+                                    y_test: pd.Series, include_report: bool = True,
+                                    y_pred: np.ndarray = None) -> Dict[str, Any]:
+        """Evaluate a classification model.
+        
+        Set ``include_report`` to False to skip building the per-class
+        classification report, and pass ``y_pred`` to score predictions that
+        were already computed.
+        """
+        if y_pred is None:
+            y_pred = model.predict(X_test)
+        y_true = np.asarray(y_test)
+        
+        # Integer labels: accuracy and confusion matrix from one bincount
+        if y_true.dtype.kind in "biu" and y_pred.dtype.kind in "biu":
+            accuracy, cm = _confusion_accuracy(y_true, y_pred)
+        else:
+            accuracy = accuracy_score(y_true, y_pred)
+            cm = confusion_matrix(y_true, y_pred)
         
-        accuracy = accuracy_score(y_test, y_pred)
+        results = {"accuracy": accuracy}
         
         # Classification report
-        report = classification_report(y_test, y_pred, output_dict=True)
+        if include_report:
+            results["classification_report"] = classification_report(y_true, y_pred, output_dict=True)
         
         # Confusion matrix
-        cm = confusion_matrix(y_test, y_pred)
+        results["confusion_matrix"] = cm.tolist()
         
-        return {
-            "accuracy": accuracy,
-            "classification_report": report,
-            "confusion_matrix": cm.tolist()
-        }
+        return results
 
     def compare_models(self, results: Dict[str, Dict[str, float]]) -> str:
         """Compare models and return the best one."""
@@ -142,21 +283,23 @@ class ModelEvaluator:
         
         # For regression, lower is better (RMSE, MAE)
         # For classification, higher is better (Accuracy)
-        regression_metrics = ["rmse", "mae"]
-        classification_metrics = ["accuracy"]
-        
         # Determine if this is regression or classification based on available metrics
-        sample_result = list(results.values())[0]
-        is_regression = any(metric in sample_result for metric in regression_metrics)
+        sample_result = next(iter(results.values()))
+        is_regression = "rmse" in sample_result or "mae" in sample_result
         
+        names = list(results)
         if is_regression:
             # Find model with lowest RMSE
-            best_model = min(results.items(), key=lambda x: x[1].get("rmse", float('inf')))
+            scores = np.fromiter((result.get("rmse", np.inf) for result in results.values()),
+                                 dtype=np.float64, count=len(names))
+            best_index = scores.argmin()
         else:
             # Find model with highest accuracy
-            best_model = max(results.items(), key=lambda x: x[1].get("accuracy", 0))
+            scores = np.fromiter((result.get("accuracy", 0) for result in results.values()),
+                                 dtype=np.float64, count=len(names))
+            best_index = scores.argmax()
         
-        return best_model[0]
+        return names[best_index]
 
 
 class ModelPipeline:
@@ -168,67 +311,154 @@ class ModelPipeline:
         self.evaluator = ModelEvaluator()
         self.trained_models = {}
         self.evaluation_results = {}
+        self.feature_names_ = None
+        self.scaler_ = None
+        self._split_cache = {}
+
+    def _split_indices(self, n_samples: int, test_size: float, random_state: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Train/test row indices, computed once per (size, test_size, seed).
+        
+        Matches train_test_split's shuffle, so the split is the same as before.
+        """
+        key = (n_samples, test_size, random_state)
+        if key not in self._split_cache:
+            n_test = int(np.ceil(test_size * n_samples)) if isinstance(test_size, float) else test_size
+            permutation = np.random.RandomState(random_state).permutation(n_samples)
+            self._split_cache[key] = (permutation[n_test:], permutation[:n_test])
+        return self._split_cache[key]
+
+    def _use_model_array(self, X: Any) -> bool:
+        """Whether X is a purely numeric frame that should become an ndarray."""
+        return (self.config.get("fast_ndarray", True) and isinstance(X, pd.DataFrame)
+                and all(dtype.kind in "biuf" for dtype in X.dtypes))
+
+    def _to_model_array(self, X: pd.DataFrame) -> np.ndarray:
+        """Convert a feature frame to a C-contiguous float32 array."""
+        return np.ascontiguousarray(X.to_numpy(dtype=np.float32, na_value=np.nan))
 
     def prepare_data(self, X: pd.DataFrame, y: pd.Series) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
-        """Prepare data for training."""
+        """Prepare data for training.
+        
+        Purely numeric features are returned as row-major float32 arrays (set
+        ``fast_ndarray`` to False in the config to keep DataFrames), so models
+        do not re-convert them on every fit and predict. Scaled features are
+        always arrays; the column names are kept in ``self.feature_names_`` and
+        the fitted scaler in ``self.scaler_``.
+        """
         test_size = self.config.get("test_size", 0.2)
         random_state = self.config.get("random_state", 42)
         
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=random_state
-        )
+        train_index, test_index = self._split_indices(len(X), test_size, random_state)
+        X_train, X_test = X.iloc[train_index], X.iloc[test_index]
+        y_train, y_test = y.iloc[train_index], y.iloc[test_index]
+        self.feature_names_ = X.columns.tolist()
+        
+        if self._use_model_array(X_train):
+            X_train, X_test = self._to_model_array(X_train), self._to_model_array(X_test)
         
-        # Scale features if required
+        # Scale features if required (float32 input stays float32 and C-ordered)
         scaling_method = self.config.get("scaling_method", "none")
         if scaling_method != "none":
-            scaler = StandardScaler()
-            X_train_scaled = pd.DataFrame(
-                scaler.fit_transform(X_train), 
-                columns=X_train.columns, 
-                index=X_train.index
-            )
-            X_test_scaled = pd.DataFrame(
-                scaler.transform(X_test), 
-                columns=X_test.columns, 
-                index=X_test.index
-            )
-            return X_train_scaled, X_test_scaled, y_train, y_test
+            self.scaler_ = StandardScaler()
+            X_train = self.scaler_.fit_transform(X_train)
+            X_test = self.scaler_.transform(X_test)
         
         return X_train, X_test, y_train, y_test
 
+    def _train_one(self, X_train: pd.DataFrame, y_train: pd.Series, model_name: str,
+                   model_params: Dict[str, Any]) -> Tuple[Any, Optional[Exception]]:
+        """Train one model, returning the error instead of raising it."""
+        try:
+            return self.trainer.train_model(X_train, y_train, model_name, model_params), None
+        except Exception as e:
+            return None, e
+
     def train_models(self, X_train: pd.DataFrame, y_train: pd.Series) -> Dict[str, Any]:
-        """Train all configured models."""
+        """Train all configured models.
+        
+        Models are independent, so they are fitted in parallel worker processes
+        (``train_n_jobs`` / ``train_backend`` in the config control this).
+        """
         models_config = self.config.get("models", {})
+        n_jobs = self.config.get("train_n_jobs", -1)
+        backend = self.config.get("train_backend", "loky")
         
-        for model_name, model_params in models_config.items():
-            try:
-                print(f"Training {model_name}...")
-                model = self.trainer.train_model(X_train, y_train, model_name, model_params)
-                self.trained_models[model_name] = model
-                print(f"Successfully trained {model_name}")
-            except Exception as e:
-                print(f"Failed to train {model_name}: {e}")
+        for model_name in models_config:
+            print(f"Training {model_name}...")
+        
+        results = Parallel(n_jobs=n_jobs, backend=backend)(
+            delayed(self._train_one)(X_train, y_train, model_name, model_params)
+            for model_name, model_params in models_config.items()
+        )
+        
+        for model_name, (model, error) in zip(models_config, results):
+            if error is not None:
+                print(f"Failed to train {model_name}: {error}")
+                continue
+            # Fitted copies come back from the workers
+            self.trainer.models[model_name] = model
+            self.trained_models[model_name] = model
+            print(f"Successfully trained {model_name}")
         
         return self.trained_models
 
+    def _evaluate_one(self, model_name: str, model: Any, X_test: Any, y_test: pd.Series,
+                      y_pred: np.ndarray = None,
+                      ss_tot: float = None) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+        """Evaluate one model, returning the error instead of raising it."""
+        try:
+            # Determine if this is a regression or classification problem
+            if self.trainer.task_kinds[model_name] == "classification" or y_test.dtype == 'object':
+                # Classification
+                return self.evaluator.evaluate_classification_model(model, X_test, y_test, y_pred=y_pred), None
+            # Regression
+            return self.evaluator.evaluate_regression_model(model, X_test, y_test, y_pred=y_pred,
+                                                            ss_tot=ss_tot), None
+        except Exception as e:
+            return None, e
+
     def evaluate_models(self, X_test: pd.DataFrame, y_test: pd.Series) -> Dict[str, Dict[str, float]]:
-        """Evaluate all trained models."""
-        for model_name, model in self.trained_models.items():
-            try:
-                print(f"Evaluating {model_name}...")
-                
-                # Determine if this is a regression or classification problem
-                if hasattr(model, 'predict_proba') or y_test.dtype == 'object':
-                    # Classification
-                    results = self.evaluator.evaluate_classification_model(model, X_test, y_test)
-                else:
-                    # Regression
-                    results = self.evaluator.evaluate_regression_model(model, X_test, y_test)
-                
-                self.evaluation_results[model_name] = results
-                print(f"Successfully evaluated {model_name}")
-            except Exception as e:
-                print(f"Failed to evaluate {model_name}: {e}")
+        """Evaluate all trained models.
+        
+        Models are evaluated on a thread pool: predict spends most of its time
+        in Cython/BLAS code that releases the GIL, and threads share X_test.
+        """
+        if not self.trained_models:
+            return self.evaluation_results
+        
+        # Validate and convert the shared test set once, not once per model
+        if self._use_model_array(X_test):
+            X_test = self._to_model_array(X_test)
+        
+        for model_name in self.trained_models:
+            print(f"Evaluating {model_name}...")
+        
+        # The target's spread is the same for every regression model
+        ss_tot = None
+        task_kinds = {self.trainer.task_kinds.get(model_name) for model_name in self.trained_models}
+        if "regression" in task_kinds and y_test.dtype != 'object':
+            ss_tot = _total_sum_of_squares(np.asarray(y_test, dtype=np.float64))
+        
+        # Linear models share one matrix multiply; the rest predict on their own
+        try:
+            stacked_predictions = _stacked_linear_predictions(self.trained_models, X_test)
+        except Exception:
+            stacked_predictions = {}
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(self.trained_models))) as executor:
+            futures = {
+                model_name: executor.submit(self._evaluate_one, model_name, model, X_test, y_test,
+                                            stacked_predictions.get(model_name), ss_tot)
+                for model_name, model in self.trained_models.items()
+            }
+        
+        for model_name, future in futures.items():
+            results, error = future.result()
+            if error is not None:
+                print(f"Failed to evaluate {model_name}: {error}")
+                continue
+            self.evaluation_results[model_name] = results
+            print(f"Successfully evaluated {model_name}")
         
         return self.evaluation_results
 
@@ -252,18 +482,29 @@ class ModelPipeline:
         return best_model_name, best_model, score
 
     def save_model(self, model: Any, model_name: str, save_path: str = None) -> str:
-        """Save a trained model."""
+        """Save a trained model.
+        
+        Models are compressed (lz4 when installed, else zlib) unless
+        ``model_compress`` is 0 in the config; uncompressed files can be
+        memory-mapped by ``load_model``.
+        """
         if save_path is None:
             model_save_dir = self.config.get("model_save_path", "models")
             os.makedirs(model_save_dir, exist_ok=True)
             save_path = os.path.join(model_save_dir, f"{model_name}.joblib")
         
-        joblib.dump(model, save_path)
+        compress = self.config.get("model_compress", ("lz4" if lz4 is not None else "zlib", 3))
+        joblib.dump(model, save_path, compress=compress, protocol=5)
         return save_path
 
     def load_model(self, model_path: str) -> Any:
-        """Load a saved model."""
-        return joblib.load(model_path)
+        """Load a saved model, memory-mapping its arrays if it is uncompressed.
+        
+        Compressed files cannot be mapped, so ``mmap_mode`` is only passed
+        when ``model_compress`` is 0.
+        """
+        mmap_mode = 'r' if self.config.get("model_compress") == 0 else None
+        return joblib.load(model_path, mmap_mode=mmap_mode)
 
 
 # Convenience functions
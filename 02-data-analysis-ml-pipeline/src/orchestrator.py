@@ -4,7 +4,9 @@ This module orchestrates the entire data analysis and ML pipeline.
 """
 
 import pandas as pd
+import logging
 import time
+from contextlib import contextmanager
 from typing import Dict, Any, List
 from src.data_ingestion import create_data_ingestion_manager
 from src.data_processing import create_data_processor, split_features_target
@@ -12,13 +14,34 @@ from src.analysis import perform_eda, generate_report
 from src.ml_pipeline import create_ml_pipeline, train_and_evaluate
 from src.deployment import deploy_model
 from src.reporting import ReportGenerator
+from src.utils import safe_save_json
+
+logger = logging.getLogger("ml_pipeline.orchestrator")
+
+
+class _ProgressLogger(logging.LoggerAdapter):
+    """Logger adapter that drops progress messages for quiet orchestrators."""
+
+    def __init__(self, logger: logging.Logger, verbose: bool):
+        super().__init__(logger, {})
+        self.verbose = verbose
+
+    def isEnabledFor(self, level: int) -> bool:
+        if not self.verbose and level < logging.WARNING:
+            return False
+        return self.logger.isEnabledFor(level)
 
 
 class PipelineOrchestrator:
-    """Orchestrates the complete pipeline."""
+    """Orchestrates the complete pipeline.
+    
+    Progress is reported through the ``ml_pipeline.orchestrator`` logger;
+    pass ``verbose=False`` to only emit warnings.
+    """
 
-    def __init__(self, config: Any):
+    def __init__(self, config: Any, verbose: bool = True):
         self.config = config
+        self.logger = _ProgressLogger(logger, verbose)
         self.data_sources = {}
         self.processed_data = None
         self.trained_models = {}
@@ -29,45 +52,48 @@ class PipelineOrchestrator:
         self.pipeline_steps = []
         self.execution_times = {}
 
+    @contextmanager
+    def _timed(self, step: str):
+        """Record the wall-clock seconds spent in a step."""
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.execution_times[step] = (time.perf_counter_ns() - start_ns) * 1e-9
+
     def run_pipeline(self):
         """Run the complete pipeline."""
-        print("Starting pipeline execution...")
+        self.logger.info("Starting pipeline execution...")
         
         # Step 1: Data Ingestion
-        start_time = time.time()
-        self._ingest_data()
-        self.execution_times["data_ingestion"] = time.time() - start_time
+        with self._timed("data_ingestion"):
+            self._ingest_data()
         
         # Step 2: Data Processing
-        start_time = time.time()
-        self._process_data()
-        self.execution_times["data_processing"] = time.time() - start_time
+        with self._timed("data_processing"):
+            self._process_data()
         
         # Step 3: Exploratory Data Analysis
-        start_time = time.time()
-        self._perform_eda()
-        self.execution_times["eda"] = time.time() - start_time
+        with self._timed("eda"):
+            self._perform_eda()
         
         # Step 4: Machine Learning
-        start_time = time.time()
-        self._train_models()
-        self.execution_times["ml_training"] = time.time() - start_time
+        with self._timed("ml_training"):
+            self._train_models()
         
         # Step 5: Model Deployment
-        start_time = time.time()
-        self._deploy_model()
-        self.execution_times["deployment"] = time.time() - start_time
+        with self._timed("deployment"):
+            self._deploy_model()
         
         # Step 6: Reporting
-        start_time = time.time()
-        self._generate_report()
-        self.execution_times["reporting"] = time.time() - start_time
+        with self._timed("reporting"):
+            self._generate_report()
         
-        print("Pipeline execution completed successfully!")
+        self.logger.info("Pipeline execution completed successfully!")
 
     def _ingest_data(self):
         """Step 1: Ingest data from sources."""
-        print("Step 1: Ingesting data...")
+        self.logger.info("Step 1: Ingesting data...")
         
         # Create data ingestion manager
         ingestion_manager = create_data_ingestion_manager(self.config.config)
@@ -76,21 +102,18 @@ class PipelineOrchestrator:
         self.data_sources = ingestion_manager.load_all_data()
         
         # Combine data if multiple sources
-        if len(self.data_sources) > 1:
-            # For simplicity, we'll use the first data source
-            first_source = list(self.data_sources.keys())[0]
-            self.processed_data = self.data_sources[first_source]
-        elif len(self.data_sources) == 1:
-            self.processed_data = list(self.data_sources.values())[0]
-        else:
+        if not self.data_sources:
             raise ValueError("No data sources found")
         
-        print(f"Loaded data with shape: {self.processed_data.shape}")
+        # For simplicity, we'll use the first data source
+        self.processed_data = next(iter(self.data_sources.values()))
+        
+        self.logger.info("Loaded data with shape: %s", self.processed_data.shape)
         self.pipeline_steps.append("data_ingestion")
 
     def _process_data(self):
         """Step 2: Process and clean data."""
-        print("Step 2: Processing data...")
+        self.logger.info("Step 2: Processing data...")
         
         if self.processed_data is None:
             raise ValueError("No data to process")
@@ -101,12 +124,12 @@ class PipelineOrchestrator:
         # Process data
         self.processed_data = processor.process_data(self.processed_data, self.config.config)
         
-        print(f"Processed data with shape: {self.processed_data.shape}")
+        self.logger.info("Processed data with shape: %s", self.processed_data.shape)
         self.pipeline_steps.append("data_processing")
 
     def _perform_eda(self):
         """Step 3: Perform exploratory data analysis."""
-        print("Step 3: Performing exploratory data analysis...")
+        self.logger.info("Step 3: Performing exploratory data analysis...")
         
         if self.processed_data is None:
             raise ValueError("No data for analysis")
@@ -118,12 +141,12 @@ class PipelineOrchestrator:
         self.eda_results = eda_results
         self.stat_results = stat_results
         
-        print("EDA completed")
+        self.logger.info("EDA completed")
         self.pipeline_steps.append("eda")
 
     def _train_models(self):
         """Step 4: Train machine learning models."""
-        print("Step 4: Training machine learning models...")
+        self.logger.info("Step 4: Training machine learning models...")
         
         if self.processed_data is None:
             raise ValueError("No data for training")
@@ -141,12 +164,12 @@ class PipelineOrchestrator:
                 X, y, self.config.config
             )
             
-            print(f"Trained {len(self.trained_models)} models")
-            print(f"Best model: {self.best_model_name} with score: {self.best_model_score:.4f}")
+            self.logger.info("Trained %d models", len(self.trained_models))
+            self.logger.info("Best model: %s with score: %.4f", self.best_model_name, self.best_model_score)
             self.pipeline_steps.append("ml_training")
             
         except Exception as e:
-            print(f"Warning: Could not train models - {e}")
+            self.logger.warning("Could not train models - %s", e)
             # Create a simple model as fallback
             from sklearn.dummy import DummyRegressor
             self.best_model = DummyRegressor()
@@ -155,10 +178,10 @@ class PipelineOrchestrator:
 
     def _deploy_model(self):
         """Step 5: Deploy the best model."""
-        print("Step 5: Deploying model...")
+        self.logger.info("Step 5: Deploying model...")
         
         if self.best_model is None:
-            print("No model to deploy")
+            self.logger.warning("No model to deploy")
             return
         
         try:
@@ -169,15 +192,15 @@ class PipelineOrchestrator:
                 self.config.config
             )
             
-            print(f"Model deployed to: {model_path}")
+            self.logger.info("Model deployed to: %s", model_path)
             self.pipeline_steps.append("deployment")
             
         except Exception as e:
-            print(f"Warning: Could not deploy model - {e}")
+            self.logger.warning("Could not deploy model - %s", e)
 
     def _generate_report(self):
         """Step 6: Generate pipeline report."""
-        print("Step 6: Generating report...")
+        self.logger.info("Step 6: Generating report...")
         
         try:
             # Create report generator
@@ -191,7 +214,7 @@ class PipelineOrchestrator:
                     self.stat_results, 
                     self.config.report_save_path
                 )
-                print(f"Report generated at: {report_path}")
+                self.logger.info("Report generated at: %s", report_path)
             
             # Generate execution summary
             summary = {
@@ -204,15 +227,14 @@ class PipelineOrchestrator:
             }
             
             summary_path = f"{self.config.report_save_path}/pipeline_summary.json"
-            import json
-            with open(summary_path, 'w') as f:
-                json.dump(summary, f, indent=2, default=str)
+            if not safe_save_json(summary, summary_path):
+                raise OSError(f"could not write {summary_path}")
             
-            print(f"Pipeline summary saved to: {summary_path}")
+            self.logger.info("Pipeline summary saved to: %s", summary_path)
             self.pipeline_steps.append("reporting")
             
         except Exception as e:
-            print(f"Warning: Could not generate report - {e}")
+            self.logger.warning("Could not generate report - %s", e)
 
     def get_pipeline_status(self) -> Dict[str, Any]:
         """Get current pipeline status."""
@@ -227,8 +249,8 @@ class PipelineOrchestrator:
 
 
 # Convenience functions
-def run_complete_pipeline(config: Any) -> PipelineOrchestrator:
+def run_complete_pipeline(config: Any, verbose: bool = True) -> PipelineOrchestrator:
     """Run the complete pipeline and return the orchestrator."""
-    orchestrator = PipelineOrchestrator(config)
+    orchestrator = PipelineOrchestrator(config, verbose)
     orchestrator.run_pipeline()
     return orchestrator
\ No newline at end of file
@@ -4,17 +4,162 @@ This module handles report generation and visualization.
 """
 
 import pandas as pd
+import numpy as np
 import json
 import os
-import matplotlib.pyplot as plt
+import math
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import seaborn as sns
 from typing import Dict, Any, List
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from jinja2 import Environment
+from src.utils import safe_save_json
+
+
+HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Data Analysis and ML Pipeline Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        h1, h2, h3 { color: #333; }
+        .section { margin-bottom: 30px; }
+        .metrics { display: flex; flex-wrap: wrap; }
+        .metric { 
+            background: #f5f5f5; 
+            padding: 15px; 
+            margin: 10px; 
+            border-radius: 5px; 
+            min-width: 200px;
+        }
+        .figures { display: flex; flex-wrap: wrap; }
+        .figure { margin: 10px; text-align: center; }
+        .figure img { max-width: 400px; height: auto; }
+        table { border-collapse: collapse; width: 100%; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+    <h1>Data Analysis and ML Pipeline Report</h1>
+    <p>Generated on: {{ generated_on }}</p>
+    {% set status = pipeline_summary.get('pipeline_status', {}) %}
+    {% set dataset_info = data_summary.get('dataset_info', {}) %}
+    <div class="section">
+        <h2>Pipeline Summary</h2>
+        <div class="metrics">
+            <div class="metric">
+                <h3>Steps Completed</h3>
+                <p>{{ status.get('steps_completed', []) | length }}</p>
+            </div>
+            <div class="metric">
+                <h3>Execution Time</h3>
+                <p>{{ '%.2f' | format(pipeline_summary.get('execution_summary', {}).get('total_execution_time', 0)) }}s</p>
+            </div>
+            <div class="metric">
+                <h3>Best Model</h3>
+                <p>{{ status.get('best_model', 'N/A') }}</p>
+            </div>
+            <div class="metric">
+                <h3>Best Score</h3>
+                <p>{{ status.get('best_score', 0) | metric }}</p>
+            </div>
+        </div>
+    </div>
+    
+    <div class="section">
+        <h2>Data Summary</h2>
+        <table>
+            <tr>
+                <th>Dataset Shape</th>
+                <td>{{ dataset_info.get('shape', 'N/A') }}</td>
+            </tr>
+            <tr>
+                <th>Memory Usage</th>
+                <td>{{ '%.2f' | format(dataset_info.get('memory_usage_mb', 0)) }} MB</td>
+            </tr>
+            <tr>
+                <th>Missing Values</th>
+                <td>{{ data_summary.get('data_quality', {}).get('missing_values', {}).values() | sum }}</td>
+            </tr>
+        </table>
+    </div>
+    
+    <div class="section">
+        <h2>Model Evaluation</h2>
+        <table>
+            <tr>
+                <th>Model</th>
+                <th>Metric</th>
+                <th>Value</th>
+            </tr>
+            {% for model_name, results in model_eval.get('model_results', {}).items() %}
+            <tr>
+                <td>{{ model_name }}</td>
+                {% if 'accuracy' in results %}
+                <td>Accuracy</td>
+                <td>{{ results['accuracy'] | metric }}</td>
+                {% elif 'rmse' in results %}
+                <td>RMSE</td>
+                <td>{{ results['rmse'] | metric }}</td>
+                {% else %}
+                <td>Score</td>
+                <td>{{ results.values() | first | default('N/A') | metric }}</td>
+                {% endif %}
+            </tr>
+            {% endfor %}
+        </table>
+    </div>
+    
+    <div class="section">
+        <h2>Visualizations</h2>
+        <div class="figures">
+            {% for fig_name in figure_names %}
+            <div class="figure">
+                <img src="{{ fig_name }}" alt="{{ fig_name }}">
+            </div>
+            {% endfor %}
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+# Report figures are viewed on screen, so 150 dpi is plenty
+FIGURE_DPI = 150
+
+
+def _new_figure(figsize) -> Figure:
+    """Create a figure on its own Agg canvas, outside pyplot's figure manager."""
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _format_metric(value: Any) -> Any:
+    """Format numeric metrics to four decimals; pass anything else through."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f"{value:.4f}"
+    return value
+
+
+def _create_template_environment() -> Environment:
+    """Create the Jinja2 environment used for HTML reports."""
+    env = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True)
+    env.filters["metric"] = _format_metric
+    return env
 
 
 class ReportGenerator:
     """Generates comprehensive reports."""
 
+    # Compiled once; every report renders from the same template
+    _html_template = _create_template_environment().from_string(HTML_TEMPLATE)
+
     def __init__(self, report_dir: str = "reports"):
         self.report_dir = report_dir
         os.makedirs(report_dir, exist_ok=True)
@@ -31,7 +176,7 @@ class ReportGenerator:
             "timestamp": datetime.now().isoformat(),
             "dataset_info": {
                 "shape": df.shape,
-                "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024 / 1024,
+                "memory_usage_mb": _estimate_memory_usage(df) / 1024 / 1024,
                 "columns": df.columns.tolist()
             },
             "data_quality": {
@@ -44,8 +189,7 @@ class ReportGenerator:
             "categorical_summary": eda_results.get("categorical_summary", {})
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        _write_json(report, output_path)
         
         return output_path
 
@@ -60,8 +204,7 @@ class ReportGenerator:
             "model_results": evaluation_results
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        _write_json(report, output_path)
         
         return output_path
 
@@ -81,8 +224,7 @@ class ReportGenerator:
             }
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        _write_json(report, output_path)
         
         return output_path
 
@@ -94,13 +236,24 @@ class ReportGenerator:
         try:
             numerical_cols = df.select_dtypes(include=['number']).columns
             if len(numerical_cols) > 0:
-                fig, ax = plt.subplots(figsize=(12, 8))
-                df[numerical_cols].hist(bins=20, ax=ax)
-                ax.set_title("Data Distribution")
+                fig = _new_figure((12, 8))
+                ncols = math.ceil(math.sqrt(len(numerical_cols)))
+                nrows = math.ceil(len(numerical_cols) / ncols)
+                axes = fig.subplots(nrows, ncols, squeeze=False).ravel()
+                values = df[numerical_cols].to_numpy(dtype=np.float64)
+                for i, (name, ax) in enumerate(zip(numerical_cols, axes)):
+                    column = values[:, i]
+                    counts, edges = np.histogram(column[~np.isnan(column)], bins=20)
+                    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge')
+                    ax.set_title(str(name))
+                    ax.grid(True)
+                for ax in axes[len(numerical_cols):]:
+                    ax.set_visible(False)
+                fig.suptitle("Data Distribution")
+                fig.tight_layout()
                 fig_path = os.path.join(self.figures_dir, "data_distribution.png")
-                plt.savefig(fig_path, dpi=300, bbox_inches='tight')
+                fig.savefig(fig_path, dpi=FIGURE_DPI)
                 saved_files.append(fig_path)
-                plt.close()
         except Exception as e:
             print(f"Warning: Could not create distribution plot - {e}")
         
@@ -108,13 +261,21 @@ class ReportGenerator:
         try:
             numerical_df = df.select_dtypes(include=['number'])
             if not numerical_df.empty and numerical_df.shape[1] > 1:
-                plt.figure(figsize=(10, 8))
-                sns.heatmap(numerical_df.corr(), annot=True, cmap='coolwarm', center=0)
-                plt.title("Feature Correlation Matrix")
+                # One BLAS-backed pass over complete rows instead of pairwise pandas loops
+                values = numerical_df.to_numpy(dtype=np.float32)
+                values = values[~np.isnan(values).any(axis=1)]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr = np.corrcoef(values, rowvar=False, dtype=np.float32)
+                
+                fig = _new_figure((10, 8))
+                ax = fig.add_subplot()
+                sns.heatmap(corr, annot=numerical_df.shape[1] <= 20, cmap='coolwarm', center=0, ax=ax,
+                            xticklabels=numerical_df.columns, yticklabels=numerical_df.columns)
+                ax.set_title("Feature Correlation Matrix")
+                fig.tight_layout()
                 corr_path = os.path.join(self.figures_dir, "correlation_matrix.png")
-                plt.savefig(corr_path, dpi=300, bbox_inches='tight')
+                fig.savefig(corr_path, dpi=FIGURE_DPI)
                 saved_files.append(corr_path)
-                plt.close()
         except Exception as e:
             print(f"Warning: Could not create correlation plot - {e}")
         
@@ -122,35 +283,31 @@ class ReportGenerator:
         if evaluation_results:
             try:
                 model_names = list(evaluation_results.keys())
-                metrics = []
                 
                 # Determine if regression or classification
-                sample_result = list(evaluation_results.values())[0]
-                is_regression = "rmse" in sample_result
-                
-                if is_regression:
-                    metric_values = [results.get("rmse", 0) for results in evaluation_results.values()]
-                    metric_name = "RMSE"
-                else:
-                    metric_values = [results.get("accuracy", 0) for results in evaluation_results.values()]
-                    metric_name = "Accuracy"
+                sample_result = next(iter(evaluation_results.values()))
+                metric_key, metric_name = ("rmse", "RMSE") if "rmse" in sample_result else ("accuracy", "Accuracy")
+                metric_values = np.fromiter(
+                    (results.get(metric_key, 0.0) for results in evaluation_results.values()),
+                    dtype=np.float64, count=len(evaluation_results)
+                )
                 
-                plt.figure(figsize=(10, 6))
-                bars = plt.bar(model_names, metric_values)
-                plt.title(f"Model Comparison - {metric_name}")
-                plt.ylabel(metric_name)
-                plt.xticks(rotation=45, ha='right')
+                fig = _new_figure((10, 6))
+                ax = fig.add_subplot()
+                positions = np.arange(len(model_names))
+                bars = ax.bar(positions, metric_values)
+                ax.set_title(f"Model Comparison - {metric_name}")
+                ax.set_ylabel(metric_name)
+                ax.set_xticks(positions)
+                ax.set_xticklabels(model_names, rotation=45, ha='right')
                 
                 # Add value labels on bars
-                for bar, value in zip(bars, metric_values):
-                    plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.01,
-                            f'{value:.3f}', ha='center', va='bottom')
+                ax.bar_label(bars, fmt='%.3f')
                 
-                plt.tight_layout()
+                fig.tight_layout()
                 model_comp_path = os.path.join(self.figures_dir, "model_comparison.png")
-                plt.savefig(model_comp_path, dpi=300, bbox_inches='tight')
+                fig.savefig(model_comp_path, dpi=FIGURE_DPI)
                 saved_files.append(model_comp_path)
-                plt.close()
             except Exception as e:
                 print(f"Warning: Could not create model comparison plot - {e}")
         
@@ -182,128 +339,14 @@ class ReportGenerator:
         except:
             pipeline_summary = {}
         
-        # Create HTML content
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Data Analysis and ML Pipeline Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        h1, h2, h3 {{ color: #333; }}
-        .section {{ margin-bottom: 30px; }}
-        .metrics {{ display: flex; flex-wrap: wrap; }}
-        .metric {{ 
-            background: #f5f5f5; 
-            padding: 15px; 
-            margin: 10px; 
-            border-radius: 5px; 
-            min-width: 200px;
-        }}
-        .figures {{ display: flex; flex-wrap: wrap; }}
-        .figure {{ margin: 10px; text-align: center; }}
-        .figure img {{ max-width: 400px; height: auto; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-    </style>
-</head>
-<body>
-    <h1>Data Analysis and ML Pipeline Report</h1>
-    <p>Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    
-    <div class="section">
-        <h2>Pipeline Summary</h2>
-        <div class="metrics">
-            <div class="metric">
-                <h3>Steps Completed</h3>
-                <p>{len(pipeline_summary.get('pipeline_status', {}).get('steps_completed', []))}</p>
-            </div>
-            <div class="metric">
-                <h3>Execution Time</h3>
-                <p>{pipeline_summary.get('execution_summary', {}).get('total_execution_time', 0):.2f}s</p>
-            </div>
-            <div class="metric">
-                <h3>Best Model</h3>
-                <p>{pipeline_summary.get('pipeline_status', {}).get('best_model', 'N/A')}</p>
-            </div>
-            <div class="metric">
-                <h3>Best Score</h3>
-                <p>{pipeline_summary.get('pipeline_status', {}).get('best_score', 0):.4f}</p>
-            </div>
-        </div>
-    </div>
-    
-    <div class="section">
-        <h2>Data Summary</h2>
-        <table>
-            <tr>
-                <th>Dataset Shape</th>
-                <td>{data_summary.get('dataset_info', {}).get('shape', 'N/A')}</td>
-            </tr>
-            <tr>
-                <th>Memory Usage</th>
-                <td>{data_summary.get('dataset_info', {}).get('memory_usage_mb', 0):.2f} MB</td>
-            </tr>
-            <tr>
-                <th>Missing Values</th>
-                <td>{sum(data_summary.get('data_quality', {}).get('missing_values', {}).values())}</td>
-            </tr>
-        </table>
-    </div>
-    
-    <div class="section">
-        <h2>Model Evaluation</h2>
-        <table>
-            <tr>
-                <th>Model</th>
-                <th>Metric</th>
-                <th>Value</th>
-            </tr>
-        """
-        
-        # Add model results
-        for model_name, results in model_eval.get('model_results', {}).items():
-            # Determine primary metric
-            if 'accuracy' in results:
-                metric_name, metric_value = 'Accuracy', results['accuracy']
-            elif 'rmse' in results:
-                metric_name, metric_value = 'RMSE', results['rmse']
-            else:
-                metric_name, metric_value = 'Score', list(results.values())[0] if results else 'N/A'
-            
-            html_content += f"""
-            <tr>
-                <td>{model_name}</td>
-                <td>{metric_name}</td>
-                <td>{metric_value if isinstance(metric_value, (int, float)) else metric_value:.4f if str(metric_value).replace('.', '').isdigit() else metric_value}</td>
-            </tr>
-            """
-        
-        html_content += """
-        </table>
-    </div>
-    
-    <div class="section">
-        <h2>Visualizations</h2>
-        <div class="figures">
-        """
-        
-        # Add figures
-        for fig_path in figure_paths:
-            fig_name = os.path.basename(fig_path)
-            html_content += f"""
-            <div class="figure">
-                <img src="{fig_name}" alt="{fig_name}">
-            </div>
-            """
-        
-        html_content += """
-        </div>
-    </div>
-</body>
-</html>
-        """
+        # Render the precompiled template in a single pass
+        html_content = self._html_template.render(
+            generated_on=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            data_summary=data_summary,
+            model_eval=model_eval,
+            pipeline_summary=pipeline_summary,
+            figure_names=[os.path.basename(fig_path) for fig_path in figure_paths]
+        )
         
         # Save HTML report
         with open(output_path, 'w') as f:
@@ -312,6 +355,27 @@ class ReportGenerator:
         return output_path
 
 
+def _estimate_memory_usage(df: pd.DataFrame, sample_rows: int = 100) -> int:
+    """Estimate a DataFrame's memory footprint in bytes.
+    
+    Fixed-width columns are sized from their dtype. Object and string columns
+    are extrapolated from the first ``sample_rows`` rows instead of measuring
+    every element with ``memory_usage(deep=True)``.
+    """
+    usage = df.memory_usage(index=True, deep=False)
+    text_columns = df.select_dtypes(include=['object', 'string']).columns
+    if len(text_columns) and len(df):
+        sample = df[text_columns].head(sample_rows)
+        usage[text_columns] = sample.memory_usage(index=False, deep=True) / len(sample) * len(df)
+    return int(usage.sum())
+
+
+def _write_json(report: Dict[str, Any], output_path: str):
+    """Write a report as indented JSON, raising if it could not be saved."""
+    if not safe_save_json(report, output_path):
+        raise OSError(f"Could not write report to {output_path}")
+
+
 # Convenience functions
 def create_report_generator(report_dir: str = "reports") -> ReportGenerator:
     """Create a report generator."""
@@ -320,16 +384,26 @@ def create_report_generator(report_dir: str = "reports") -> ReportGenerator:
 
 def generate_complete_report(orchestrator: Any, df: pd.DataFrame, eda_results: Dict[str, Any], 
                            evaluation_results: Dict[str, Dict[str, float]], report_dir: str = "reports") -> List[str]:
-    """Generate a complete report package."""
-    reporter = ReportGenerator(report_dir)
+    """Generate a complete report package.
     
-    # Generate JSON reports
-    data_summary_path = reporter.generate_data_summary_report(df, eda_results)
-    model_eval_path = reporter.generate_model_evaluation_report(evaluation_results)
-    pipeline_summary_path = reporter.generate_pipeline_summary(orchestrator)
+    The JSON reports and the figures are independent, so they are written
+    concurrently; figures use their own Agg canvases and are thread-safe.
+    """
+    reporter = ReportGenerator(report_dir)
     
-    # Create visualizations
-    figure_paths = reporter.create_visualizations(df, evaluation_results)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Generate JSON reports
+        data_summary_future = executor.submit(reporter.generate_data_summary_report, df, eda_results)
+        model_eval_future = executor.submit(reporter.generate_model_evaluation_report, evaluation_results)
+        pipeline_summary_future = executor.submit(reporter.generate_pipeline_summary, orchestrator)
+        
+        # Create visualizations
+        figures_future = executor.submit(reporter.create_visualizations, df, evaluation_results)
+        
+        data_summary_path = data_summary_future.result()
+        model_eval_path = model_eval_future.result()
+        pipeline_summary_path = pipeline_summary_future.result()
+        figure_paths = figures_future.result()
     
     # Generate HTML report
     html_report_path = reporter.generate_html_report(
@@ -5,19 +5,73 @@ This module contains various utility functions for the data analysis and ML pipe
 
 import os
 import json
-import pickle
+import mmap
 import logging
-from typing import Dict, Any, List, Optional
+import logging.handlers
+import queue
+import math
+import re
+import sys
+import atexit
+import threading
+from typing import Dict, Any, List, Optional, Callable, Tuple, Union
 import hashlib
 import time
-from functools import wraps
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache, wraps
+
+import joblib
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
+
+try:
+    import lz4
+except ImportError:  # optional: joblib falls back to zlib compression
+    lz4 = None
+
+try:
+    from tqdm import tqdm
+except ImportError:  # optional: fall back to rate-limited prints
+    tqdm = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:  # optional: the stdlib parser covers ISO 8601 too
+    _parse_iso_datetime = datetime.fromisoformat
 
 
 # Logging setup
+_log_listener = None
+
+
 def setup_logging(log_file: str = "pipeline.log", log_level: int = logging.INFO) -> logging.Logger:
-    """Setup logging for the pipeline."""
+    """Setup logging for the pipeline.
+    
+    Log calls only enqueue the record; a background listener thread owns the
+    file and console handlers, so callers never block on log I/O. Calling
+    this again replaces the previous handlers instead of adding duplicates.
+    """
+    global _log_listener
+    
     logger = logging.getLogger("ml_pipeline")
     logger.setLevel(log_level)
+    logger.propagate = False
+    
+    # Tear down a previous setup
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+    for handler in list(logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            logger.removeHandler(handler)
     
     # Create file handler
     file_handler = logging.FileHandler(log_file)
@@ -34,22 +88,42 @@ def setup_logging(log_file: str = "pipeline.log", log_level: int = logging.INFO)
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Route records through a queue to the listener thread
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _log_listener.start()
     
     return logger
 
 
+@atexit.register
+def _stop_log_listener():
+    """Flush queued log records at interpreter exit."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
 # Performance monitoring
 def timing_decorator(func):
-    """Decorator to time function execution."""
+    """Decorator to time function execution.
+    
+    Timing is enabled by setting ``PIPELINE_TIMING`` in the environment. The
+    check happens at decoration time, so when it is unset the function is
+    returned unwrapped and calls carry no overhead. When enabled, each call
+    prints its elapsed time to stdout.
+    """
+    if not os.environ.get("PIPELINE_TIMING"):
+        return func
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"{func.__name__} executed in {end_time - start_time:.4f} seconds")
+        elapsed_ns = time.perf_counter_ns() - start_time
+        print(f"{func.__name__} executed in {elapsed_ns / 1e9:.4f} seconds")
         return result
     return wrapper
 
@@ -69,15 +143,36 @@ def validate_dataframe(df, required_columns: List[str] = None) -> bool:
     return True
 
 
-def validate_json_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> bool:
-    """Validate JSON data against a schema."""
-    for key, expected_type in schema.items():
+CompiledSchema = List[Tuple[str, Any, Callable[[Any], bool]]]
+
+
+def compile_schema(schema: Dict[str, Any]) -> CompiledSchema:
+    """Prebuild the per-field type checks for ``validate_json_schema``.
+    
+    Compile once and pass the result in when validating many records.
+    """
+    def make_check(expected_type):
+        if isinstance(expected_type, type):
+            # Exact-type hit skips the isinstance MRO walk
+            return lambda value: type(value) is expected_type or isinstance(value, expected_type)
+        return lambda value: isinstance(value, expected_type)
+    
+    return [(key, expected_type, make_check(expected_type)) for key, expected_type in schema.items()]
+
+
+def validate_json_schema(data: Dict[str, Any], schema: Union[Dict[str, Any], CompiledSchema]) -> bool:
+    """Validate JSON data against a schema or a ``compile_schema`` result."""
+    if type(schema) is not list:
+        schema = compile_schema(schema)
+    
+    for key, expected_type, check in schema:
         if key not in data:
             print(f"Missing required field: {key}")
             return False
         
-        if not isinstance(data[key], expected_type):
-            print(f"Field {key} has incorrect type. Expected {expected_type}, got {type(data[key])}")
+        value = data[key]
+        if not check(value):
+            print(f"Field {key} has incorrect type. Expected {expected_type}, got {type(value)}")
             return False
     
     return True
@@ -85,10 +180,17 @@ def validate_json_schema(data: Dict[str, Any], schema: Dict[str, Any]) -> bool:
 
 # File operations
 def safe_load_json(file_path: str) -> Optional[Dict[str, Any]]:
-    """Safely load JSON file."""
+    """Safely load JSON file.
+    
+    With orjson the file is memory-mapped and parsed straight from the
+    mapping, without reading it into an intermediate bytes object.
+    """
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            if orjson is None:
+                return json.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return orjson.loads(memoryview(mm))
     except Exception as e:
         print(f"Error loading JSON file {file_path}: {e}")
         return None
@@ -97,8 +199,16 @@ def safe_load_json(file_path: str) -> Optional[Dict[str, Any]]:
 def safe_save_json(data: Dict[str, Any], file_path: str) -> bool:
     """Safely save data to JSON file."""
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
         return True
     except Exception as e:
         print(f"Error saving JSON file {file_path}: {e}")
@@ -106,20 +216,26 @@ def safe_save_json(data: Dict[str, Any], file_path: str) -> bool:
 
 
 def safe_load_pickle(file_path: str) -> Optional[Any]:
-    """Safely load pickle file."""
+    """Safely load pickle file.
+    
+    Reads both joblib files and plain pickles.
+    """
     try:
-        with open(file_path, 'rb') as f:
-            return pickle.load(f)
+        return joblib.load(file_path)
     except Exception as e:
         print(f"Error loading pickle file {file_path}: {e}")
         return None
 
 
 def safe_save_pickle(data: Any, file_path: str) -> bool:
-    """Safely save data to pickle file."""
+    """Safely save data to pickle file.
+    
+    Uses joblib, which stores numpy arrays out of band, with fast lz4
+    compression when it is installed.
+    """
     try:
-        with open(file_path, 'wb') as f:
-            pickle.dump(data, f)
+        compress = ("lz4", 1) if lz4 is not None else ("zlib", 1)
+        joblib.dump(data, file_path, compress=compress, protocol=5)
         return True
     except Exception as e:
         print(f"Error saving pickle file {file_path}: {e}")
@@ -134,37 +250,119 @@ def hash_dataframe(df, method: str = "sha256") -> str:
     else:
         raise ValueError(f"Unsupported hash method: {method}")
     
-    # Convert dataframe to string and hash
-    df_str = df.to_string().encode('utf-8')
-    hash_obj.update(df_str)
+    # Hash the index and column headers, then each column's raw buffer
+    _hash_values(hash_obj, df.index)
+    for name, dtype in df.dtypes.items():
+        hash_obj.update(str(name).encode('utf-8'))
+        hash_obj.update(str(dtype).encode('utf-8'))
+    
+    dtypes = set(df.dtypes)
+    dtype = dtypes.pop() if len(dtypes) == 1 else None
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufc":
+        # Homogeneous numeric frames: the column buffers back to back are the
+        # transposed 2-D block, so hash it in one update
+        hash_obj.update(np.ascontiguousarray(df.to_numpy().T).view(np.uint8))
+    else:
+        for _, col in df.items():
+            _hash_values(hash_obj, col)
     
     return hash_obj.hexdigest()
 
 
+def _hash_values(hash_obj, values) -> None:
+    """Feed the bytes of a Series or Index into ``hash_obj`` without copying.
+    
+    Fixed-width NumPy data is hashed straight from its buffer; object and
+    extension dtypes are reduced to pandas' per-value uint64 hashes first.
+    """
+    arr = values.to_numpy()
+    if arr.dtype.kind not in "biufcmM":
+        arr = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    hash_obj.update(np.ascontiguousarray(arr).view(np.uint8))
+
+
+# Digests of recently hashed files as (realpath, method) -> (mtime_ns, size,
+# digest), least recently used first; a changed file replaces its own entry
+_FILE_HASH_CACHE_SIZE = 256
+_file_hash_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_file_hash_lock = threading.Lock()
+
+
 def hash_file(file_path: str, method: str = "sha256") -> str:
-    """Create hash of file."""
+    """Create hash of file.
+    
+    The file is read in 1 MiB blocks into one reused buffer, so large files
+    are hashed at disk speed without a new bytes object per block. Digests
+    are cached until the file's modification time or size changes, so
+    re-hashing an unchanged file costs one ``stat`` call. Only the most
+    recently hashed files are kept.
+    """
     if method == "sha256":
         hash_obj = hashlib.sha256()
     else:
         raise ValueError(f"Unsupported hash method: {method}")
     
     try:
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_obj.update(chunk)
-        return hash_obj.hexdigest()
+        st = os.stat(file_path)
+        cache_key = (os.path.realpath(file_path), method)
+        with _file_hash_lock:
+            entry = _file_hash_cache.get(cache_key)
+            if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+                _file_hash_cache.move_to_end(cache_key)
+                return entry[2]
+        
+        buf = bytearray(1 << 20)
+        view = memoryview(buf)
+        with open(file_path, 'rb', buffering=0) as f:
+            while n := f.readinto(buf):
+                hash_obj.update(view[:n])
+        digest = hash_obj.hexdigest()
+        with _file_hash_lock:
+            _file_hash_cache[cache_key] = (st.st_mtime_ns, st.st_size, digest)
+            _file_hash_cache.move_to_end(cache_key)
+            if len(_file_hash_cache) > _FILE_HASH_CACHE_SIZE:
+                _file_hash_cache.popitem(last=False)
+        return digest
     except Exception as e:
         print(f"Error hashing file {file_path}: {e}")
         return ""
 
 
 # Memory management
-def get_memory_usage() -> Dict[str, int]:
-    """Get current memory usage."""
+if sys.platform.startswith("linux"):
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+    _TOTAL_MEMORY = os.sysconf("SC_PHYS_PAGES") * _PAGE_SIZE
+else:
+    _PAGE_SIZE = None
+
+
+@lru_cache(maxsize=1)
+def _psutil_process(pid: int):
+    """Return the psutil handle for ``pid``; rebuilt after a fork."""
     import psutil
-    import os
+    return psutil.Process(pid)
+
+
+def get_memory_usage() -> Dict[str, int]:
+    """Get current memory usage.
+    
+    On Linux this is a single read of /proc/self/statm; other platforms use
+    psutil with a cached Process handle.
+    """
+    if _PAGE_SIZE is not None:
+        try:
+            with open("/proc/self/statm", 'rb') as f:
+                vms_pages, rss_pages = f.read().split()[:2]
+            rss = int(rss_pages) * _PAGE_SIZE
+            return {
+                "rss": rss,  # Resident Set Size
+                "vms": int(vms_pages) * _PAGE_SIZE,  # Virtual Memory Size
+                "percent": rss / _TOTAL_MEMORY * 100
+            }
+        except OSError:
+            pass
     
-    process = psutil.Process(os.getpid())
+    process = _psutil_process(os.getpid())
     memory_info = process.memory_info()
     
     return {
@@ -174,26 +372,45 @@ def get_memory_usage() -> Dict[str, int]:
     }
 
 
+_MEMORY_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_memory_size(bytes_size: int) -> str:
-    """Format memory size in human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} TB"
+    """Format memory size in human-readable format.
+    
+    Sizes below 1 KB, including negative ones, are shown in bytes; NaN and
+    infinity fall through to TB.
+    """
+    if bytes_size < 1024:
+        return f"{bytes_size:.1f} B"
+    if not math.isfinite(bytes_size):
+        return f"{bytes_size:.1f} TB"
+    # Each unit is 2**10 of the previous one, so the bit length picks it
+    index = min(max((int(abs(bytes_size)).bit_length() - 1) // 10, 0), len(_MEMORY_UNITS) - 1)
+    return f"{bytes_size / (1 << (10 * index)):.1f} {_MEMORY_UNITS[index]}"
 
 
 # Configuration utilities
 def merge_configs(default_config: Dict[str, Any], user_config: Dict[str, Any]) -> Dict[str, Any]:
-    """Merge default and user configurations."""
+    """Merge default and user configurations.
+    
+    Nested dictionaries are merged with an explicit stack rather than
+    recursion, so arbitrarily deep configs are fine. Only the dictionaries
+    along overridden paths are copied; the inputs are never modified.
+    """
     merged = default_config.copy()
+    stack = [(merged, user_config)]
     
-    for key, value in user_config.items():
-        if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-            # Recursively merge nested dictionaries
-            merged[key] = merge_configs(merged[key], value)
-        else:
-            merged[key] = value
+    while stack:
+        target, overrides = stack.pop()
+        for key, value in overrides.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                # Merge nested dictionaries into a private copy
+                target[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
     
     return merged
 
@@ -209,17 +426,33 @@ def validate_config(config: Dict[str, Any], required_keys: List[str]) -> bool:
 
 # Progress tracking
 class ProgressTracker:
-    """Track progress of long-running operations."""
+    """Track progress of long-running operations.
+    
+    Draws a tqdm bar when tqdm is installed. Otherwise a progress line is
+    printed at most once every ``mininterval`` seconds, plus the final step.
+    """
     
-    def __init__(self, total_steps: int):
+    def __init__(self, total_steps: int, mininterval: float = 0.1):
         self.total_steps = total_steps
         self.current_step = 0
         self.start_time = time.time()
+        self.mininterval = mininterval
+        self._last_print = float("-inf")
+        self._bar = tqdm(total=total_steps, mininterval=mininterval) if tqdm is not None else None
     
     def update(self, step_name: str = ""):
         """Update progress."""
         self.current_step += 1
-        elapsed_time = time.time() - self.start_time
+        if self._bar is not None:
+            self._bar.set_postfix_str(step_name, refresh=False)
+            self._bar.update(1)
+            return
+        
+        now = time.time()
+        if now - self._last_print < self.mininterval and self.current_step < self.total_steps:
+            return
+        self._last_print = now
+        elapsed_time = now - self.start_time
         progress_percent = (self.current_step / self.total_steps) * 100
         
         # Estimate remaining time
@@ -232,6 +465,11 @@ class ProgressTracker:
         
         print(f"Progress: {progress_percent:.1f}% ({self.current_step}/{self.total_steps}) "
               f"- {step_name} - ETA: {estimated_remaining:.1f}s")
+    
+    def close(self):
+        """Finish the progress display."""
+        if self._bar is not None:
+            self._bar.close()
 
 
 # Data sampling
@@ -243,18 +481,38 @@ def sample_dataframe(df, n: int = 1000, random_state: int = 42):
 
 
 # String utilities
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
-    import re
-    text = text.lower()
-    text = re.sub(r'[^a-z0-9]+', '-', text)
-    text = text.strip('-')
-    return text
+    return _SLUG_RE.sub('-', text.lower()).strip('-')
 
 
 # Date utilities
+_DATE_CACHE_SIZE = 4096  # Distinct date strings remembered by parse_date_string
+
+
 def parse_date_string(date_str: str) -> Optional[str]:
-    """Parse date string to standard format."""
+    """Parse date string to standard format.
+    
+    ISO 8601 strings take a C fast path; anything else goes through the
+    forgiving dateutil parser. Results for the most recent date strings are
+    cached; unhashable input is parsed without the cache.
+    """
+    try:
+        return _parse_date_string_cached(date_str)
+    except TypeError:  # Unhashable input cannot be a cache key
+        return _parse_date_string(date_str)
+
+
+def _parse_date_string(date_str: str) -> Optional[str]:
+    """Parse one date string; never raises."""
+    try:
+        return _parse_iso_datetime(date_str).isoformat()
+    except (TypeError, ValueError):
+        pass
+    
     import dateutil.parser as parser
     
     try:
@@ -264,6 +522,9 @@ def parse_date_string(date_str: str) -> Optional[str]:
         return None
 
 
+_parse_date_string_cached = lru_cache(maxsize=_DATE_CACHE_SIZE)(_parse_date_string)
+
+
 # Convenience aliases
 load_json = safe_load_json
 save_json = safe_save_json
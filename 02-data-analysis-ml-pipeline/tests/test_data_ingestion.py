@@ -10,7 +10,14 @@ import sys
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from data_ingestion import DataIngestionManager, CSVDataSource
+from data_ingestion import DataIngestionManager, DataSource, CSVDataSource
+
+
+class FrameDataSource(DataSource):
+    """Data source that returns the frame given in its config."""
+
+    def load_data(self) -> pd.DataFrame:
+        return self.config["frame"]
 
 
 class TestDataIngestion(unittest.TestCase):
@@ -44,6 +51,16 @@ class TestDataIngestion(unittest.TestCase):
         self.assertEqual(len(df), 3)
         self.assertEqual(list(df.columns), ['id', 'name', 'age'])
 
+    def test_csv_data_source_chunks(self):
+        """Test reading a CSV data source in chunks."""
+        config = {"path": self.test_csv_path, "chunksize": 2}
+        source = CSVDataSource("test_csv", config)
+        
+        chunks = list(source.iter_chunks())
+        
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), source.load_data())
+
     def test_data_ingestion_manager(self):
         """Test data ingestion manager."""
         manager = DataIngestionManager()
@@ -58,6 +75,18 @@ class TestDataIngestion(unittest.TestCase):
         self.assertIsInstance(df, pd.DataFrame)
         self.assertEqual(len(df), 3)
 
+    def test_load_all_data(self):
+        """Test loading all sources, skipping ones that fail."""
+        manager = DataIngestionManager()
+        manager.add_source("first", "csv", {"path": self.test_csv_path})
+        manager.add_source("missing", "csv", {"path": "does_not_exist.csv"})
+        manager.add_source("second", "csv", {"path": self.test_csv_path})
+        
+        data = manager.load_all_data()
+        
+        self.assertEqual(list(data.keys()), ["first", "second"])
+        self.assertEqual(len(data["second"]), 3)
+
     def test_combine_data(self):
         """Test combining data from multiple sources."""
         manager = DataIngestionManager()
@@ -73,6 +102,30 @@ class TestDataIngestion(unittest.TestCase):
         self.assertEqual(len(combined_df), 3)
         self.assertIn('source', combined_df.columns)
 
+    def test_combine_string_data_repeated_source(self):
+        """Test combining all-string data with a source listed twice."""
+        manager = DataIngestionManager()
+        self.sample_data[['name']].to_csv(self.test_csv_path, index=False)
+        manager.add_source("names", "csv", {"path": self.test_csv_path})
+        
+        combined_df = manager.combine_data(["names", "names"])
+        
+        self.assertEqual(list(combined_df['name']), ['Alice', 'Bob', 'Charlie'] * 2)
+        self.assertEqual(list(combined_df['source']), ['names'] * 6)
+
+    def test_combine_data_keeps_extension_dtypes(self):
+        """Test that nullable extension dtypes survive combining."""
+        manager = DataIngestionManager()
+        manager.register_source("frame", FrameDataSource)
+        frame = pd.DataFrame({'count': pd.array([1, None, 3], dtype="Int64")})
+        manager.add_source("first", "frame", {"frame": frame})
+        manager.add_source("second", "frame", {"frame": frame})
+        
+        combined_df = manager.combine_data()
+        
+        self.assertEqual(combined_df['count'].dtype, pd.Int64Dtype())
+        self.assertEqual(int(combined_df['count'].isna().sum()), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
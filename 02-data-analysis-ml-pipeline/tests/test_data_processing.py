@@ -80,6 +80,33 @@ class TestDataTransformer(unittest.TestCase):
         
         # Check that category column is now numeric
         self.assertTrue(np.issubdtype(df_encoded['category'].dtype, np.number))
+        
+        # Check that codes map back to the original labels
+        decoded = transformer.decode_categorical('category', df_encoded['category'])
+        self.assertEqual(list(decoded), list(self.sample_data['category']))
+
+    def test_decode_missing_code(self):
+        """Test that the missing code -1 decodes to NaN."""
+        transformer = DataTransformer()
+        transformer.encode_categorical(self.sample_data, ['category'])
+        
+        decoded = transformer.decode_categorical('category', [0, -1, 1])
+        
+        self.assertEqual(decoded[0], 'A')
+        self.assertTrue(pd.isna(decoded[1]))
+        self.assertEqual(decoded[2], 'B')
+
+    def test_hashed_dummy_variables(self):
+        """Test feature hashing of categorical variables."""
+        transformer = DataTransformer()
+        
+        df_hashed = transformer.create_dummy_variables(self.sample_data, ['category'], method="hash", n_features=8)
+        
+        self.assertNotIn('category', df_hashed.columns)
+        self.assertEqual(df_hashed.shape, (5, 3 + 8))
+        # Exactly one category token per row
+        hashed = df_hashed.filter(like='hash_').sparse.to_dense()
+        self.assertTrue((hashed.abs().sum(axis=1) == 1).all())
 
 
 class TestFeatureEngineer(unittest.TestCase):
@@ -156,6 +183,24 @@ class TestDataProcessor(unittest.TestCase):
         self.assertIsInstance(df_processed, pd.DataFrame)
         self.assertGreater(len(df_processed.columns), len(self.sample_data.columns))  # More columns after processing
 
+    def test_compile(self):
+        """Test that the compiled row transform matches process_data."""
+        processor = DataProcessor()
+        numeric_data = self.sample_data.drop(columns=['category']).dropna()
+        config = dict(self.config, feature_engineering={
+            "polynomial": True,
+            "polynomial_columns": ["value1", "value2"],
+            "polynomial_degree": 3,
+            "interactions": True,
+            "interaction_columns": ["value1", "value2"]
+        })
+        
+        df_processed = processor.process_data(numeric_data, config)
+        transform = processor.compile()
+        
+        np.testing.assert_allclose(transform(numeric_data.to_numpy()), df_processed.to_numpy(), rtol=1e-5, atol=1e-5)
+        self.assertEqual(transform(numeric_data.to_numpy()[0]).shape, (len(df_processed.columns),))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -3,23 +3,77 @@ Bank Account System
 This program demonstrates Object-Oriented Programming concepts with a bank account system.
 """
 
+import io
+import math
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Transaction codes; history stores (code, cents, count) and formats on display.
+# Consecutive transactions of the same type are merged into one entry whose
+# cents are their total and count is how many were merged.
+OP_DEPOSIT = 0
+OP_WITHDRAW = 1
+OP_INTEREST = 2
+
+TRANSACTION_FORMATS = {
+    OP_DEPOSIT: "Deposited %s",
+    OP_WITHDRAW: "Withdrew %s",
+    OP_INTEREST: "Interest applied: %s",
+}
+
+def _to_cents(amount):
+    """Convert a dollar amount to whole cents."""
+    if not math.isfinite(amount):
+        raise ValueError(f"Amount must be a finite number, not {amount}")
+    return round(amount * 100)
+
+
+def _format_cents(cents):
+    """Format whole cents as dollars, e.g. _format_cents(1250) -> "$12.50"."""
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"${sign}{dollars}.{cents:02d}"
+
+
+def _read_float(prompt, default=None):
+    """Prompt for a number on stdin; an empty answer returns default if given."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    text = sys.stdin.readline().strip()
+    if not text and default is not None:
+        return default
+    return float(text)  # Raises ValueError on bad or empty input, like float(input())
+
+
 class BankAccount:
     """A class representing a bank account."""
     
-    # Class variable (shared by all instances)
+    __slots__ = ("account_holder", "_balance_cents", "transaction_history")
+    
+    # Class variables (shared by all instances)
     bank_name = "Python National Bank"
+    MAX_HISTORY = 1024  # Oldest transactions are dropped beyond this; None keeps all
     
     def __init__(self, account_holder, initial_balance=0):
         """Initialize a new bank account."""
         self.account_holder = account_holder  # Instance variable
-        self.balance = initial_balance        # Instance variable
-        self.transaction_history = []         # Instance variable
+        # Kept in whole cents so deposits and withdrawals add up exactly
+        self._balance_cents = _to_cents(initial_balance)  # Instance variable
+        self.transaction_history = deque(maxlen=self.MAX_HISTORY)  # Instance variable
+    
+    @property
+    def balance(self):
+        """The account balance in dollars."""
+        return self._balance_cents / 100
     
     def deposit(self, amount):
         """Deposit money into the account."""
-        if amount > 0:
-            self.balance += amount
-            self.transaction_history.append(f"Deposited ${amount:.2f}")
+        cents = _to_cents(amount)
+        if cents > 0:
+            self._balance_cents += cents
+            self._record(OP_DEPOSIT, cents)
             return True
         else:
             print("Deposit amount must be positive.")
@@ -27,40 +81,72 @@ class BankAccount:
     
     def withdraw(self, amount):
         """Withdraw money from the account."""
-        if amount <= 0:
+        cents = _to_cents(amount)
+        if cents <= 0:
             print("Withdrawal amount must be positive.")
             return False
-        elif amount > self.balance:
+        elif cents > self._balance_cents:
             print("Insufficient funds.")
             return False
         else:
-            self.balance -= amount
-            self.transaction_history.append(f"Withdrew ${amount:.2f}")
+            self._balance_cents -= cents
+            self._record(OP_WITHDRAW, cents)
             return True
     
+    def _record(self, code, cents):
+        """Add a transaction to the history, merging repeats of the last type."""
+        history = self.transaction_history
+        if history and history[-1][0] == code:
+            _, total, count = history[-1]
+            history[-1] = (code, total + cents, count + 1)
+        else:
+            history.append((code, cents, 1))
+    
     def get_balance(self):
         """Get the current account balance."""
-        return self.balance
+        return self._balance_cents / 100
+    
+    def format_balance(self):
+        """Get the current account balance formatted as dollars."""
+        return _format_cents(self._balance_cents)
+    
+    def apply_interest_if_available(self):
+        """Apply interest if this account type earns it."""
+        print("Interest can only be applied to savings accounts.")
+    
+    def _info_lines(self):
+        """Get the lines shown by display_account_info."""
+        return [
+            f"Bank: {self.bank_name}",
+            f"Account Holder: {self.account_holder}",
+            f"Balance: {_format_cents(self._balance_cents)}",
+        ]
     
     def display_account_info(self):
         """Display account information."""
-        print(f"Bank: {self.bank_name}")
-        print(f"Account Holder: {self.account_holder}")
-        print(f"Balance: ${self.balance:.2f}")
+        # Written in one call rather than one print per line
+        sys.stdout.write("\n".join(self._info_lines()) + "\n")
     
     def display_transaction_history(self):
         """Display transaction history."""
         if not self.transaction_history:
             print("No transactions yet.")
         else:
-            print("Transaction History:")
-            for transaction in self.transaction_history:
-                print(f"  {transaction}")
+            # Built in a buffer and written in one call, however long the history
+            buf = io.StringIO()
+            buf.write("Transaction History:\n")
+            for code, cents, count in self.transaction_history:
+                buf.write("  ")
+                buf.write(TRANSACTION_FORMATS[code] % _format_cents(cents))
+                buf.write(f" ({count} transactions)\n" if count > 1 else "\n")
+            sys.stdout.write(buf.getvalue())
 
 
 class SavingsAccount(BankAccount):
     """A class representing a savings account with interest."""
     
+    __slots__ = ("interest_rate",)
+    
     def __init__(self, account_holder, initial_balance=0, interest_rate=0.02):
         """Initialize a new savings account."""
         super().__init__(account_holder, initial_balance)
@@ -68,20 +154,81 @@ class SavingsAccount(BankAccount):
     
     def apply_interest(self):
         """Apply interest to the account."""
-        interest = self.balance * self.interest_rate
-        self.balance += interest
-        self.transaction_history.append(f"Interest applied: ${interest:.2f}")
-        print(f"Interest of ${interest:.2f} applied. New balance: ${self.balance:.2f}")
+        interest = round(self._balance_cents * self.interest_rate)  # In cents
+        self._balance_cents += interest
+        self._record(OP_INTEREST, interest)
+        print(f"Interest of {_format_cents(interest)} applied. "
+              f"New balance: {_format_cents(self._balance_cents)}")
     
-    def display_account_info(self):
-        """Display savings account information."""
-        super().display_account_info()
-        print(f"Interest Rate: {self.interest_rate*100:.2f}%")
+    def apply_interest_if_available(self):
+        """Apply interest to the account."""
+        self.apply_interest()
+    
+    def _info_lines(self):
+        """Get the lines shown by display_account_info."""
+        return super()._info_lines() + [f"Interest Rate: {self.interest_rate*100:.2f}%"]
+
+
+def _apply_interest(balances, interest_rates):
+    """Get the balances after applying interest at the given rates."""
+    return array('d', [balance + balance * rate
+                       for balance, rate in zip(balances, interest_rates)])
+
+
+class SavingsAccountPool:
+    """Many savings accounts stored column-wise (one array per field).
+    
+    Keeping balances and rates in flat arrays lets an interest sweep over
+    every account run as a single loop instead of one method call each.
+    """
+    
+    __slots__ = ("account_holders", "balances", "interest_rates")
+    
+    def __init__(self):
+        """Initialize an empty pool."""
+        self.account_holders = []
+        self.balances = array('d')
+        self.interest_rates = array('d')
+    
+    def add_account(self, account_holder, initial_balance=0, interest_rate=0.02):
+        """Add an account and return its index in the pool."""
+        self.account_holders.append(account_holder)
+        self.balances.append(initial_balance)
+        self.interest_rates.append(interest_rate)
+        return len(self.balances) - 1
+    
+    def apply_interest_all(self, workers=1):
+        """Apply interest to every account in one pass.
+        
+        Accounts are independent, so with workers > 1 the pool is split into
+        chunks that separate processes handle in parallel. Starting the
+        processes has a cost, so this only pays off for very large pools.
+        """
+        if workers <= 1 or not self.balances:
+            self.balances = _apply_interest(self.balances, self.interest_rates)
+            return
+        
+        size = -(-len(self.balances) // workers)  # Ceiling division
+        starts = range(0, len(self.balances), size)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(_apply_interest,
+                                  [self.balances[i:i + size] for i in starts],
+                                  [self.interest_rates[i:i + size] for i in starts])
+            balances = array('d')
+            for chunk in chunks:
+                balances.extend(chunk)
+        self.balances = balances
+    
+    def total_balance(self):
+        """Get the combined balance of all accounts."""
+        return sum(self.balances)
 
 
 class CheckingAccount(BankAccount):
     """A class representing a checking account with overdraft protection."""
     
+    __slots__ = ("overdraft_limit",)
+    
     def __init__(self, account_holder, initial_balance=0, overdraft_limit=100):
         """Initialize a new checking account."""
         super().__init__(account_holder, initial_balance)
@@ -89,21 +236,21 @@ class CheckingAccount(BankAccount):
     
     def withdraw(self, amount):
         """Withdraw money from the checking account with overdraft protection."""
-        if amount <= 0:
+        cents = _to_cents(amount)
+        if cents <= 0:
             print("Withdrawal amount must be positive.")
             return False
-        elif amount > (self.balance + self.overdraft_limit):
+        elif cents > self._balance_cents + _to_cents(self.overdraft_limit):
             print("Transaction denied. Exceeds overdraft limit.")
             return False
         else:
-            self.balance -= amount
-            self.transaction_history.append(f"Withdrew ${amount:.2f}")
+            self._balance_cents -= cents
+            self._record(OP_WITHDRAW, cents)
             return True
     
-    def display_account_info(self):
-        """Display checking account information."""
-        super().display_account_info()
-        print(f"Overdraft Limit: ${self.overdraft_limit:.2f}")
+    def _info_lines(self):
+        """Get the lines shown by display_account_info."""
+        return super()._info_lines() + [f"Overdraft Limit: {_format_cents(_to_cents(self.overdraft_limit))}"]
 
 
 def main():
@@ -121,7 +268,7 @@ def main():
     basic_account.display_account_info()
     basic_account.deposit(500)
     basic_account.withdraw(200)
-    print(f"Updated balance: ${basic_account.get_balance():.2f}")
+    print(f"Updated balance: {basic_account.format_balance()}")
     basic_account.display_transaction_history()
     
     print("\n" + "="*50)
@@ -140,13 +287,71 @@ def main():
     checking_account.display_account_info()
     checking_account.withdraw(1600)  # This should work due to overdraft
     checking_account.withdraw(300)   # This should be denied
-    print(f"Updated balance: ${checking_account.get_balance():.2f}")
+    print(f"Updated balance: {checking_account.format_balance()}")
     checking_account.display_transaction_history()
     
+    print("\n" + "="*50)
+    
+    # Demonstrate an interest sweep over many accounts at once
+    print("Savings Pool Operations:")
+    pool = SavingsAccountPool()
+    for i in range(1000):
+        pool.add_account(f"Customer {i}", 1000, 0.03)
+    pool.apply_interest_all()
+    print(f"Applied interest to {len(pool.balances)} accounts. "
+          f"Total balance: {_format_cents(_to_cents(pool.total_balance()))}")
+    
     # Interactive banking system
     print("\nInteractive Banking System:")
     current_account = basic_account
     
+    # Menu handlers, looked up by choice instead of an if/elif chain
+    def show_info():
+        current_account.display_account_info()
+        current_account.display_transaction_history()
+    
+    def deposit():
+        try:
+            amount = _read_float("Enter deposit amount: $")
+            if current_account.deposit(amount):
+                print(f"Deposit successful. New balance: {current_account.format_balance()}")
+        except ValueError:
+            print("Invalid amount. Please enter a number.")
+    
+    def withdraw():
+        try:
+            amount = _read_float("Enter withdrawal amount: $")
+            if current_account.withdraw(amount):
+                print(f"Withdrawal successful. New balance: {current_account.format_balance()}")
+        except ValueError:
+            print("Invalid amount. Please enter a number.")
+    
+    def switch_account():
+        nonlocal current_account
+        print("Available accounts:")
+        print("1. Alice Johnson (Basic)")
+        print("2. Bob Smith (Savings)")
+        print("3. Charlie Brown (Checking)")
+        account_choice = input("Select account (1-3): ")
+        
+        accounts = {'1': basic_account, '2': savings_account, '3': checking_account}
+        if account_choice in accounts:
+            current_account = accounts[account_choice]
+            print(f"Switched to {current_account.account_holder}'s account")
+        else:
+            print("Invalid choice.")
+    
+    def invalid_choice():
+        print("Invalid choice. Please enter 1-6.")
+    
+    handlers = {
+        '1': show_info,
+        '2': deposit,
+        '3': withdraw,
+        '4': switch_account,
+        '5': lambda: current_account.apply_interest_if_available(),
+    }
+    
     while True:
         print("\nChoose an operation:")
         print("1. Display account info")
@@ -160,49 +365,8 @@ def main():
         
         if choice == '6':
             break
-            
-        if choice == '1':
-            current_account.display_account_info()
-            current_account.display_transaction_history()
-        elif choice == '2':
-            try:
-                amount = float(input("Enter deposit amount: $"))
-                if current_account.deposit(amount):
-                    print(f"Deposit successful. New balance: ${current_account.get_balance():.2f}")
-            except ValueError:
-                print("Invalid amount. Please enter a number.")
-        elif choice == '3':
-            try:
-                amount = float(input("Enter withdrawal amount: $"))
-                if current_account.withdraw(amount):
-                    print(f"Withdrawal successful. New balance: ${current_account.get_balance():.2f}")
-            except ValueError:
-                print("Invalid amount. Please enter a number.")
-        elif choice == '4':
-            print("Available accounts:")
-            print("1. Alice Johnson (Basic)")
-            print("2. Bob Smith (Savings)")
-            print("3. Charlie Brown (Checking)")
-            account_choice = input("Select account (1-3): ")
-            
-            if account_choice == '1':
-                current_account = basic_account
-                print("Switched to Alice Johnson's account")
-            elif account_choice == '2':
-                current_account = savings_account
-                print("Switched to Bob Smith's account")
-            elif account_choice == '3':
-                current_account = checking_account
-                print("Switched to Charlie Brown's account")
-            else:
-                print("Invalid choice.")
-        elif choice == '5':
-            if isinstance(current_account, SavingsAccount):
-                current_account.apply_interest()
-            else:
-                print("Interest can only be applied to savings accounts.")
-        else:
-            print("Invalid choice. Please enter 1-6.")
+        
+        handlers.get(choice, invalid_choice)()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,119 +4,184 @@ This program demonstrates Object-Oriented Programming concepts with geometric sh
 """
 
 import math
+import sys
+
+
+def _read_float(prompt, default=None):
+    """Prompt for a number on stdin; an empty answer returns default if given."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    text = sys.stdin.readline().strip()
+    if not text and default is not None:
+        return default
+    return float(text)  # Raises ValueError on bad or empty input, like float(input())
+
+
+def _heron(a, b, c):
+    """Area of a triangle with sides a >= b >= c (Heron's formula).
+    
+    Uses Kahan's rearrangement, which stays accurate for needle-like
+    triangles where the semi-perimeter form loses digits to cancellation.
+    """
+    return 0.25 * math.sqrt((a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c)))
+
 
 class Shape:
-    """Abstract base class for all shapes."""
+    """Abstract base class for all shapes.
+    
+    Shapes are treated as immutable: area and perimeter are computed once,
+    when the shape is created, and reused afterwards.
+    """
+    
+    __slots__ = ("color", "_area", "_perimeter")
     
     def __init__(self, color="white"):
         """Initialize a shape with a color."""
         self.color = color
     
-    def area(self):
+    def _compute_area(self):
         """Calculate the area of the shape."""
         raise NotImplementedError("Subclass must implement abstract method")
     
-    def perimeter(self):
+    def _compute_perimeter(self):
         """Calculate the perimeter of the shape."""
         raise NotImplementedError("Subclass must implement abstract method")
     
+    def _cache_measurements(self):
+        """Compute area and perimeter once the dimensions are set."""
+        self._area = self._compute_area()
+        self._perimeter = self._compute_perimeter()
+    
+    def area(self):
+        """Get the area of the shape."""
+        return self._area
+    
+    def perimeter(self):
+        """Get the perimeter of the shape."""
+        return self._perimeter
+    
+    def measurements(self):
+        """Get the area and perimeter of the shape as a tuple."""
+        return self._area, self._perimeter
+    
+    def _info_lines(self):
+        """Get the lines shown by display_info."""
+        return [
+            f"Shape: {self.__class__.__name__}",
+            f"Color: {self.color}",
+            f"Area: {self.area():.2f}",
+            f"Perimeter: {self.perimeter():.2f}",
+        ]
+    
     def display_info(self):
         """Display information about the shape."""
-        print(f"Shape: {self.__class__.__name__}")
-        print(f"Color: {self.color}")
-        print(f"Area: {self.area():.2f}")
-        print(f"Perimeter: {self.perimeter():.2f}")
+        # Written in one call rather than one print per line
+        sys.stdout.write("\n".join(self._info_lines()) + "\n")
 
 
 class Rectangle(Shape):
     """A class representing a rectangle."""
     
+    __slots__ = ("width", "height")
+    
     def __init__(self, width, height, color="white"):
         """Initialize a rectangle."""
         super().__init__(color)
         self.width = width
         self.height = height
+        self._cache_measurements()
     
-    def area(self):
+    def _compute_area(self):
         """Calculate the area of the rectangle."""
         return self.width * self.height
     
-    def perimeter(self):
+    def _compute_perimeter(self):
         """Calculate the perimeter of the rectangle."""
         return 2 * (self.width + self.height)
     
-    def display_info(self):
-        """Display information about the rectangle."""
-        super().display_info()
-        print(f"Width: {self.width}")
-        print(f"Height: {self.height}")
+    def _info_lines(self):
+        """Get the lines shown by display_info."""
+        return super()._info_lines() + [f"Width: {self.width}", f"Height: {self.height}"]
 
 
 class Circle(Shape):
     """A class representing a circle."""
     
+    __slots__ = ("radius",)
+    
+    # Class-level constants avoid a math.pi lookup on every call
+    _PI = math.pi
+    _TAU = 2.0 * math.pi
+    
     def __init__(self, radius, color="white"):
         """Initialize a circle."""
         super().__init__(color)
         self.radius = radius
+        self._cache_measurements()
     
-    def area(self):
+    def _compute_area(self):
         """Calculate the area of the circle."""
-        return math.pi * self.radius ** 2
+        r = self.radius
+        return Circle._PI * r * r
     
-    def perimeter(self):
+    def _compute_perimeter(self):
         """Calculate the perimeter (circumference) of the circle."""
-        return 2 * math.pi * self.radius
+        return Circle._TAU * self.radius
     
-    def display_info(self):
-        """Display information about the circle."""
-        super().display_info()
-        print(f"Radius: {self.radius}")
-        print(f"Diameter: {2 * self.radius}")
+    def _info_lines(self):
+        """Get the lines shown by display_info."""
+        return super()._info_lines() + [f"Radius: {self.radius}", f"Diameter: {2 * self.radius}"]
 
 
 class Triangle(Shape):
     """A class representing a triangle."""
     
+    __slots__ = ("side1", "side2", "side3", "_sides")
+    
     def __init__(self, side1, side2, side3, color="white"):
         """Initialize a triangle."""
         super().__init__(color)
         self.side1 = side1
         self.side2 = side2
         self.side3 = side3
+        self._sides = tuple(sorted((side1, side2, side3), reverse=True))  # Longest first
+        self._cache_measurements()
     
-    def area(self):
+    def _compute_area(self):
         """Calculate the area of the triangle using Heron's formula."""
-        # Semi-perimeter
-        s = self.perimeter() / 2
-        # Heron's formula
-        area = math.sqrt(s * (s - self.side1) * (s - self.side2) * (s - self.side3))
-        return area
+        return _heron(*self._sides)
     
-    def perimeter(self):
+    def is_right(self, tolerance=0.0001):
+        """Check if the triangle is a right triangle (no square root needed)."""
+        c, b, a = self._sides
+        return abs(a * a + b * b - c * c) < tolerance
+    
+    def _compute_perimeter(self):
         """Calculate the perimeter of the triangle."""
         return self.side1 + self.side2 + self.side3
     
-    def display_info(self):
-        """Display information about the triangle."""
-        super().display_info()
-        print(f"Side 1: {self.side1}")
-        print(f"Side 2: {self.side2}")
-        print(f"Side 3: {self.side3}")
+    def _info_lines(self):
+        """Get the lines shown by display_info."""
+        return super()._info_lines() + [
+            f"Side 1: {self.side1}",
+            f"Side 2: {self.side2}",
+            f"Side 3: {self.side3}",
+        ]
 
 
 class Square(Rectangle):
     """A class representing a square."""
     
+    __slots__ = ("side",)
+    
     def __init__(self, side, color="white"):
         """Initialize a square."""
         super().__init__(side, side, color)
         self.side = side
     
-    def display_info(self):
-        """Display information about the square."""
-        super().display_info()
-        print(f"Side: {self.side}")
+    def _info_lines(self):
+        """Get the lines shown by display_info."""
+        return super()._info_lines() + [f"Side: {self.side}"]
 
 
 def main():
@@ -140,9 +205,12 @@ def main():
         shape.display_info()
         print("-" * 20)
     
-    # Calculate total area and perimeter
-    total_area = sum(shape.area() for shape in shapes)
-    total_perimeter = sum(shape.perimeter() for shape in shapes)
+    # Calculate total area and perimeter in a single pass
+    total_area = total_perimeter = 0.0
+    for shape in shapes:
+        area, perimeter = shape.measurements()
+        total_area += area
+        total_perimeter += perimeter
     
     print(f"Total Area: {total_area:.2f}")
     print(f"Total Perimeter: {total_perimeter:.2f}")
@@ -164,10 +232,7 @@ def main():
     # Triangle operations
     print("\nTriangle operations:")
     triangle.display_info()
-    # Check if it's a right triangle
-    sides = sorted([triangle.side1, triangle.side2, triangle.side3])
-    is_right = abs(sides[0]**2 + sides[1]**2 - sides[2]**2) < 0.0001
-    print(f"Is it a right triangle? {is_right}")
+    print(f"Is it a right triangle? {triangle.is_right()}")
     
     # Square operations
     print("\nSquare operations:")
@@ -176,6 +241,63 @@ def main():
     
     # Interactive shape creation
     print("\nInteractive Shape Creation:")
+    
+    # Menu handlers, looked up by choice instead of an if/elif chain
+    def create_rectangle():
+        try:
+            width = _read_float("Enter width: ")
+            height = _read_float("Enter height: ")
+            color = input("Enter color [white]: ") or "white"
+            shape = Rectangle(width, height, color)
+            shape.display_info()
+        except ValueError:
+            print("Invalid input. Please enter numbers for dimensions.")
+    
+    def create_circle():
+        try:
+            radius = _read_float("Enter radius: ")
+            color = input("Enter color [white]: ") or "white"
+            shape = Circle(radius, color)
+            shape.display_info()
+        except ValueError:
+            print("Invalid input. Please enter a number for radius.")
+    
+    def create_triangle():
+        try:
+            side1 = _read_float("Enter side 1: ")
+            side2 = _read_float("Enter side 2: ")
+            side3 = _read_float("Enter side 3: ")
+            color = input("Enter color [white]: ") or "white"
+            # Check if sides can form a triangle: the two shorter sides must
+            # add up to more than the longest one
+            shortest, middle, longest = sorted((side1, side2, side3))
+            if shortest + middle > longest:
+                shape = Triangle(side1, side2, side3, color)
+                shape.display_info()
+            else:
+                print("Invalid triangle. The sum of any two sides must be greater than the third side.")
+        except ValueError:
+            print("Invalid input. Please enter numbers for sides.")
+    
+    def create_square():
+        try:
+            side = _read_float("Enter side length: ")
+            color = input("Enter color [white]: ") or "white"
+            shape = Square(side, color)
+            shape.display_info()
+        except ValueError:
+            print("Invalid input. Please enter a number for side length.")
+    
+    def invalid_choice():
+        print("Invalid choice. Please enter 1-5.")
+    
+    handlers = {
+        '1': create_rectangle,
+        '2': create_circle,
+        '3': create_triangle,
+        '4': create_square,
+    }
+    
     while True:
         print("\nChoose a shape to create:")
         print("1. Rectangle")
@@ -188,48 +310,8 @@ def main():
         
         if choice == '5':
             break
-            
-        if choice == '1':
-            try:
-                width = float(input("Enter width: "))
-                height = float(input("Enter height: "))
-                color = input("Enter color [white]: ") or "white"
-                shape = Rectangle(width, height, color)
-                shape.display_info()
-            except ValueError:
-                print("Invalid input. Please enter numbers for dimensions.")
-        elif choice == '2':
-            try:
-                radius = float(input("Enter radius: "))
-                color = input("Enter color [white]: ") or "white"
-                shape = Circle(radius, color)
-                shape.display_info()
-            except ValueError:
-                print("Invalid input. Please enter a number for radius.")
-        elif choice == '3':
-            try:
-                side1 = float(input("Enter side 1: "))
-                side2 = float(input("Enter side 2: "))
-                side3 = float(input("Enter side 3: "))
-                color = input("Enter color [white]: ") or "white"
-                # Check if sides can form a triangle
-                if (side1 + side2 > side3) and (side1 + side3 > side2) and (side2 + side3 > side1):
-                    shape = Triangle(side1, side2, side3, color)
-                    shape.display_info()
-                else:
-                    print("Invalid triangle. The sum of any two sides must be greater than the third side.")
-            except ValueError:
-                print("Invalid input. Please enter numbers for sides.")
-        elif choice == '4':
-            try:
-                side = float(input("Enter side length: "))
-                color = input("Enter color [white]: ") or "white"
-                shape = Square(side, color)
-                shape.display_info()
-            except ValueError:
-                print("Invalid input. Please enter a number for side length.")
-        else:
-            print("Invalid choice. Please enter 1-5.")
+        
+        handlers.get(choice, invalid_choice)()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
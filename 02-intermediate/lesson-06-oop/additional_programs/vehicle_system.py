@@ -3,14 +3,38 @@ Vehicle System
 This program demonstrates Object-Oriented Programming concepts with a vehicle management system.
 """
 
+import sys
+from array import array
+
+
+def _read_float(prompt, default=None):
+    """Prompt for a number on stdin; an empty answer returns default if given."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    text = sys.stdin.readline().strip()
+    if not text and default is not None:
+        return default
+    return float(text)  # Raises ValueError on bad or empty input, like float(input())
+
+
 class Vehicle:
     """Abstract base class for all vehicles."""
     
+    __slots__ = ("make", "model", "year", "color", "is_running", "speed", "_name")
+    
+    _INFO_TMPL = (
+        "Vehicle: {name}\n"
+        "Color: {color}\n"
+        "Engine Status: {status}\n"
+        "Current Speed: {speed} mph"
+    )
+    
     def __init__(self, make, model, year, color="white"):
         """Initialize a vehicle."""
         self.make = make
         self.model = model
         self.year = year
+        self._name = f"{year} {make} {model}"  # Make, model and year never change
         self.color = color
         self.is_running = False
         self.speed = 0
@@ -19,24 +43,24 @@ class Vehicle:
         """Start the vehicle's engine."""
         if not self.is_running:
             self.is_running = True
-            print(f"The {self.year} {self.make} {self.model}'s engine is now running.")
+            print(f"The {self._name}'s engine is now running.")
         else:
-            print(f"The {self.year} {self.make} {self.model}'s engine is already running.")
+            print(f"The {self._name}'s engine is already running.")
     
     def stop_engine(self):
         """Stop the vehicle's engine."""
         if self.is_running:
             self.is_running = False
             self.speed = 0
-            print(f"The {self.year} {self.make} {self.model}'s engine has been turned off.")
+            print(f"The {self._name}'s engine has been turned off.")
         else:
-            print(f"The {self.year} {self.make} {self.model}'s engine is already off.")
+            print(f"The {self._name}'s engine is already off.")
     
     def accelerate(self, speed_increase):
         """Accelerate the vehicle."""
         if self.is_running:
             self.speed += speed_increase
-            print(f"The {self.year} {self.make} {self.model} is now traveling at {self.speed} mph.")
+            print(f"The {self._name} is now traveling at {self.speed} mph.")
         else:
             print("You need to start the engine first!")
     
@@ -44,21 +68,34 @@ class Vehicle:
         """Apply brakes to the vehicle."""
         if self.is_running:
             self.speed = max(0, self.speed - speed_decrease)
-            print(f"The {self.year} {self.make} {self.model} slowed down to {self.speed} mph.")
+            print(f"The {self._name} slowed down to {self.speed} mph.")
         else:
             print("The vehicle is not moving.")
     
+    def specific_operations(self):
+        """Run the interactive menu of operations specific to this vehicle type."""
+        print("No specific operations for this vehicle.")
+    
+    def _info_lines(self):
+        """Get the lines shown by display_info."""
+        return [self._INFO_TMPL.format_map({
+            "name": self._name,
+            "color": self.color,
+            "status": "Running" if self.is_running else "Off",
+            "speed": self.speed,
+        })]
+    
     def display_info(self):
         """Display information about the vehicle."""
-        print(f"Vehicle: {self.year} {self.make} {self.model}")
-        print(f"Color: {self.color}")
-        print(f"Engine Status: {'Running' if self.is_running else 'Off'}")
-        print(f"Current Speed: {self.speed} mph")
+        # Written in one call rather than one print per line
+        sys.stdout.write("\n".join(self._info_lines()) + "\n")
 
 
 class Car(Vehicle):
     """A class representing a car."""
     
+    __slots__ = ("num_doors", "fuel_level")
+    
     def __init__(self, make, model, year, color="white", num_doors=4):
         """Initialize a car."""
         super().__init__(make, model, year, color)
@@ -82,16 +119,38 @@ class Car(Vehicle):
         self.fuel_level = min(100, self.fuel_level + amount)
         print(f"Refueled. Fuel level is now {self.fuel_level:.1f}%.")
     
-    def display_info(self):
-        """Display information about the car."""
-        super().display_info()
-        print(f"Number of Doors: {self.num_doors}")
-        print(f"Fuel Level: {self.fuel_level:.1f}%")
+    def specific_operations(self):
+        """Run the interactive drive/refuel menu."""
+        print("Car specific operations:")
+        print("1. Drive")
+        print("2. Refuel")
+        op_choice = input("Enter choice (1-2): ")
+        if op_choice == '1':
+            try:
+                distance = _read_float("Enter distance to drive (miles): ")
+                self.drive(distance)
+            except ValueError:
+                print("Invalid input. Please enter a number.")
+        elif op_choice == '2':
+            try:
+                amount = _read_float("Enter refuel amount [100]: ", default=100.0)
+                self.refuel(amount)
+            except ValueError:
+                print("Invalid input. Please enter a number.")
+    
+    def _info_lines(self):
+        """Get the lines shown by display_info."""
+        return super()._info_lines() + [
+            f"Number of Doors: {self.num_doors}",
+            f"Fuel Level: {self.fuel_level:.1f}%",
+        ]
 
 
 class Motorcycle(Vehicle):
     """A class representing a motorcycle."""
     
+    __slots__ = ("engine_size", "has_sidecar")
+    
     def __init__(self, make, model, year, color="black", engine_size=600):
         """Initialize a motorcycle."""
         super().__init__(make, model, year, color)
@@ -101,7 +160,7 @@ class Motorcycle(Vehicle):
     def wheelie(self):
         """Perform a wheelie."""
         if self.is_running and self.speed > 20:
-            print(f"The {self.year} {self.make} {self.model} pops a wheelie!")
+            print(f"The {self._name} pops a wheelie!")
         elif self.is_running:
             print("You need to go faster to pop a wheelie!")
         else:
@@ -110,18 +169,32 @@ class Motorcycle(Vehicle):
     def add_sidecar(self):
         """Add a sidecar to the motorcycle."""
         self.has_sidecar = True
-        print(f"A sidecar has been added to the {self.year} {self.make} {self.model}.")
+        print(f"A sidecar has been added to the {self._name}.")
     
-    def display_info(self):
-        """Display information about the motorcycle."""
-        super().display_info()
-        print(f"Engine Size: {self.engine_size}cc")
-        print(f"Has Sidecar: {'Yes' if self.has_sidecar else 'No'}")
+    def specific_operations(self):
+        """Run the interactive wheelie/sidecar menu."""
+        print("Motorcycle specific operations:")
+        print("1. Wheelie")
+        print("2. Add sidecar")
+        op_choice = input("Enter choice (1-2): ")
+        if op_choice == '1':
+            self.wheelie()
+        elif op_choice == '2':
+            self.add_sidecar()
+    
+    def _info_lines(self):
+        """Get the lines shown by display_info."""
+        return super()._info_lines() + [
+            f"Engine Size: {self.engine_size}cc",
+            f"Has Sidecar: {'Yes' if self.has_sidecar else 'No'}",
+        ]
 
 
 class Truck(Vehicle):
     """A class representing a truck."""
     
+    __slots__ = ("cargo_capacity", "current_cargo")
+    
     def __init__(self, make, model, year, color="white", cargo_capacity=1000):
         """Initialize a truck."""
         super().__init__(make, model, year, color)
@@ -144,12 +217,104 @@ class Truck(Vehicle):
         else:
             print(f"Cannot unload {weight} pounds. Only {self.current_cargo} pounds of cargo available.")
     
-    def display_info(self):
-        """Display information about the truck."""
-        super().display_info()
-        print(f"Cargo Capacity: {self.cargo_capacity} pounds")
-        print(f"Current Cargo: {self.current_cargo} pounds")
-        print(f"Capacity Used: {self.current_cargo/self.cargo_capacity*100:.1f}%")
+    def specific_operations(self):
+        """Run the interactive load/unload menu."""
+        print("Truck specific operations:")
+        print("1. Load cargo")
+        print("2. Unload cargo")
+        op_choice = input("Enter choice (1-2): ")
+        if op_choice == '1':
+            try:
+                weight = _read_float("Enter cargo weight (pounds): ")
+                self.load_cargo(weight)
+            except ValueError:
+                print("Invalid input. Please enter a number.")
+        elif op_choice == '2':
+            try:
+                weight = _read_float("Enter cargo weight to unload (pounds): ")
+                self.unload_cargo(weight)
+            except ValueError:
+                print("Invalid input. Please enter a number.")
+    
+    def _info_lines(self):
+        """Get the lines shown by display_info."""
+        return super()._info_lines() + [
+            f"Cargo Capacity: {self.cargo_capacity} pounds",
+            f"Current Cargo: {self.current_cargo} pounds",
+            f"Capacity Used: {self.current_cargo/self.cargo_capacity*100:.1f}%",
+        ]
+
+
+class FleetSimulation:
+    """Numeric state of many vehicles for simulations, stored column-wise.
+    
+    The Vehicle classes print on every operation. A simulation stepping
+    thousands of vehicles keeps only the numbers, one array per field, and
+    updates every vehicle in a single loop per step.
+    """
+    
+    __slots__ = ("speeds", "fuel_levels", "is_running")
+    
+    FUEL_PER_MILE = 0.1  # Same simplified consumption as Car.drive
+    
+    def __init__(self, num_vehicles):
+        """Initialize a fleet of stopped vehicles with full tanks."""
+        self.speeds = array('d', [0.0]) * num_vehicles
+        self.fuel_levels = array('d', [100.0]) * num_vehicles
+        self.is_running = [False] * num_vehicles
+    
+    def start_all(self):
+        """Start every vehicle's engine."""
+        self.is_running = [True] * len(self.is_running)
+    
+    def accelerate_all(self, speed_increase):
+        """Accelerate every running vehicle."""
+        self.speeds = array('d', [speed + speed_increase if running else speed
+                                  for speed, running in zip(self.speeds, self.is_running)])
+    
+    def brake_all(self, speed_decrease):
+        """Slow down every running vehicle, stopping at zero."""
+        self.speeds = array('d', [max(0.0, speed - speed_decrease) if running else speed
+                                  for speed, running in zip(self.speeds, self.is_running)])
+    
+    def drive_all(self, distance):
+        """Drive every running vehicle that has enough fuel."""
+        fuel_consumed = distance * self.FUEL_PER_MILE
+        self.fuel_levels = array('d', [fuel - fuel_consumed if running and fuel >= fuel_consumed else fuel
+                                       for fuel, running in zip(self.fuel_levels, self.is_running)])
+    
+    def simulate(self, steps, speed_increase, distance):
+        """Accelerate and drive the whole fleet for a number of steps."""
+        for _ in range(steps):
+            self.accelerate_all(speed_increase)
+            self.drive_all(distance)
+
+
+class TruckFleet(FleetSimulation):
+    """Cargo state of many trucks, stored column-wise like FleetSimulation."""
+    
+    __slots__ = ("cargo", "capacity")
+    
+    def __init__(self, num_trucks, cargo_capacity=1000):
+        """Initialize a fleet of empty trucks with the same cargo capacity."""
+        super().__init__(num_trucks)
+        self.cargo = array('d', [0.0]) * num_trucks
+        self.capacity = array('d', [float(cargo_capacity)]) * num_trucks
+    
+    def load_all(self, weights):
+        """Load weights[i] onto truck i where it fits; return which loads were accepted."""
+        new_cargo = [cargo + weight for cargo, weight in zip(self.cargo, weights)]
+        accepted = [new <= capacity for new, capacity in zip(new_cargo, self.capacity)]
+        self.cargo = array('d', [new if ok else cargo
+                                 for new, ok, cargo in zip(new_cargo, accepted, self.cargo)])
+        return accepted
+    
+    def unload_all(self, weights):
+        """Unload weights[i] from truck i where available; return which unloads were accepted."""
+        accepted = [weight <= cargo for cargo, weight in zip(self.cargo, weights)]
+        self.cargo = array('d', [cargo - weight if ok else cargo
+                                 for cargo, weight, ok in zip(self.cargo, weights, accepted)])
+        return accepted
 
 
 def main():
@@ -210,10 +375,67 @@ def main():
     truck.unload_cargo(200)
     truck.display_info()
     
+    # Fleet simulation
+    print("\nFleet simulation:")
+    fleet = FleetSimulation(1000)
+    fleet.start_all()
+    fleet.simulate(steps=10, speed_increase=5, distance=10)
+    print(f"Simulated {len(fleet.speeds)} vehicles for 10 steps. "
+          f"Average speed: {sum(fleet.speeds) / len(fleet.speeds):.1f} mph, "
+          f"average fuel level: {sum(fleet.fuel_levels) / len(fleet.fuel_levels):.1f}%")
+    
+    trucks = TruckFleet(1000, cargo_capacity=2000)
+    accepted = trucks.load_all([600.0 * (i % 5) for i in range(1000)])
+    print(f"Loaded cargo onto {sum(accepted)} of {len(accepted)} trucks. "
+          f"Total cargo: {sum(trucks.cargo):.0f} pounds")
+    
     # Interactive vehicle management
     print("\nInteractive Vehicle Management:")
     current_vehicle = car
     
+    # Menu handlers, looked up by choice instead of an if/elif chain
+    def accelerate():
+        try:
+            speed = int(input("Enter speed increase: "))
+            current_vehicle.accelerate(speed)
+        except ValueError:
+            print("Invalid input. Please enter a number.")
+    
+    def brake():
+        try:
+            speed = int(input("Enter speed decrease: "))
+            current_vehicle.brake(speed)
+        except ValueError:
+            print("Invalid input. Please enter a number.")
+    
+    def switch_vehicle():
+        nonlocal current_vehicle
+        print("Available vehicles:")
+        print("1. Toyota Camry (Car)")
+        print("2. Harley-Davidson Street 750 (Motorcycle)")
+        print("3. Ford F-150 (Truck)")
+        vehicle_choice = input("Select vehicle (1-3): ")
+        
+        vehicles_by_choice = {'1': car, '2': motorcycle, '3': truck}
+        if vehicle_choice in vehicles_by_choice:
+            current_vehicle = vehicles_by_choice[vehicle_choice]
+            print(f"Switched to {current_vehicle.make} {current_vehicle.model}")
+        else:
+            print("Invalid choice.")
+    
+    def invalid_choice():
+        print("Invalid choice. Please enter 1-8.")
+    
+    handlers = {
+        '1': lambda: current_vehicle.display_info(),
+        '2': lambda: current_vehicle.start_engine(),
+        '3': lambda: current_vehicle.stop_engine(),
+        '4': accelerate,
+        '5': brake,
+        '6': switch_vehicle,
+        '7': lambda: current_vehicle.specific_operations(),
+    }
+    
     while True:
         print("\nChoose an operation:")
         print("1. Display vehicle info")
@@ -229,89 +451,8 @@ def main():
         
         if choice == '8':
             break
-            
-        if choice == '1':
-            current_vehicle.display_info()
-        elif choice == '2':
-            current_vehicle.start_engine()
-        elif choice == '3':
-            current_vehicle.stop_engine()
-        elif choice == '4':
-            try:
-                speed = int(input("Enter speed increase: "))
-                current_vehicle.accelerate(speed)
-            except ValueError:
-                print("Invalid input. Please enter a number.")
-        elif choice == '5':
-            try:
-                speed = int(input("Enter speed decrease: "))
-                current_vehicle.brake(speed)
-            except ValueError:
-                print("Invalid input. Please enter a number.")
-        elif choice == '6':
-            print("Available vehicles:")
-            print("1. Toyota Camry (Car)")
-            print("2. Harley-Davidson Street 750 (Motorcycle)")
-            print("3. Ford F-150 (Truck)")
-            vehicle_choice = input("Select vehicle (1-3): ")
-            
-            if vehicle_choice == '1':
-                current_vehicle = car
-                print("Switched to Toyota Camry")
-            elif vehicle_choice == '2':
-                current_vehicle = motorcycle
-                print("Switched to Harley-Davidson Street 750")
-            elif vehicle_choice == '3':
-                current_vehicle = truck
-                print("Switched to Ford F-150")
-            else:
-                print("Invalid choice.")
-        elif choice == '7':
-            if isinstance(current_vehicle, Car):
-                print("Car specific operations:")
-                print("1. Drive")
-                print("2. Refuel")
-                op_choice = input("Enter choice (1-2): ")
-                if op_choice == '1':
-                    try:
-                        distance = float(input("Enter distance to drive (miles): "))
-                        current_vehicle.drive(distance)
-                    except ValueError:
-                        print("Invalid input. Please enter a number.")
-                elif op_choice == '2':
-                    try:
-                        amount = float(input("Enter refuel amount [100]: ") or "100")
-                        current_vehicle.refuel(amount)
-                    except ValueError:
-                        print("Invalid input. Please enter a number.")
-            elif isinstance(current_vehicle, Motorcycle):
-                print("Motorcycle specific operations:")
-                print("1. Wheelie")
-                print("2. Add sidecar")
-                op_choice = input("Enter choice (1-2): ")
-                if op_choice == '1':
-                    current_vehicle.wheelie()
-                elif op_choice == '2':
-                    current_vehicle.add_sidecar()
-            elif isinstance(current_vehicle, Truck):
-                print("Truck specific operations:")
-                print("1. Load cargo")
-                print("2. Unload cargo")
-                op_choice = input("Enter choice (1-2): ")
-                if op_choice == '1':
-                    try:
-                        weight = float(input("Enter cargo weight (pounds): "))
-                        current_vehicle.load_cargo(weight)
-                    except ValueError:
-                        print("Invalid input. Please enter a number.")
-                elif op_choice == '2':
-                    try:
-                        weight = float(input("Enter cargo weight to unload (pounds): "))
-                        current_vehicle.unload_cargo(weight)
-                    except ValueError:
-                        print("Invalid input. Please enter a number.")
-        else:
-            print("Invalid choice. Please enter 1-8.")
+        
+        handlers.get(choice, invalid_choice)()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
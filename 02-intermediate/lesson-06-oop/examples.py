@@ -43,6 +43,9 @@ print("=== CLASS VS INSTANCE VARIABLES ===\n")
 class Cat:
     """Cat class demonstrating class and instance variables."""
     
+    # Only these instance attributes are allowed; no per-instance __dict__
+    __slots__ = ("name", "color")
+    
     # Class variable (shared by all instances)
     species = "Felis catus"
     population = 0
@@ -113,6 +116,8 @@ print("=== PROPERTIES ===\n")
 class Person:
     """Person class with properties."""
     
+    __slots__ = ("_name", "_age")
+    
     def __init__(self, name, age):
         self._name = name
         self._age = age
@@ -251,6 +256,8 @@ print("=== SPECIAL METHODS ===\n")
 class Vector:
     """2D Vector class with operator overloading."""
     
+    __slots__ = ("x", "y")
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -294,6 +301,59 @@ print(f"v1 * 2: {v1 * 2}")
 print(f"v1 == v2: {v1 == v2}")
 print(f"len(v1): {len(v1)}")
 
+# Many vectors at once: one array per coordinate (structure of arrays)
+# instead of one Vector object per element
+import math
+from array import array
+from operator import add, sub
+
+class VectorArray:
+    """A batch of 2D vectors stored as parallel x and y arrays."""
+    
+    __slots__ = ("x", "y")
+    
+    def __init__(self, xs, ys):
+        self.x = array('d', xs)
+        self.y = array('d', ys)
+    
+    @classmethod
+    def from_vectors(cls, vectors):
+        """Alternative constructor from Vector objects."""
+        return cls([v.x for v in vectors], [v.y for v in vectors])
+    
+    def __len__(self):
+        """Return the number of vectors."""
+        return len(self.x)
+    
+    def __getitem__(self, index):
+        """Get one vector as a Vector."""
+        return Vector(self.x[index], self.y[index])
+    
+    def __add__(self, other):
+        """Add two batches element-wise."""
+        return VectorArray(map(add, self.x, other.x), map(add, self.y, other.y))
+    
+    def __sub__(self, other):
+        """Subtract two batches element-wise."""
+        return VectorArray(map(sub, self.x, other.x), map(sub, self.y, other.y))
+    
+    def __mul__(self, scalar):
+        """Multiply every vector by a scalar."""
+        return VectorArray([x * scalar for x in self.x], [y * scalar for y in self.y])
+    
+    def magnitudes(self):
+        """Return the length of every vector."""
+        return array('d', map(math.hypot, self.x, self.y))
+    
+    def total(self):
+        """Return the sum of all vectors as a single Vector."""
+        return Vector(math.fsum(self.x), math.fsum(self.y))
+
+batch = VectorArray.from_vectors([v1, v2, Vector(6, 8)])
+print(f"batch * 2: {[str(v) for v in batch * 2]}")
+print(f"batch magnitudes: {list(batch.magnitudes())}")
+print(f"batch total: {batch.total()}")
+
 
 # ============================================
 # 8. Abstract Base Classes
@@ -359,6 +419,8 @@ print("=== CLASS & STATIC METHODS ===\n")
 class Employee:
     """Employee class with class and static methods."""
     
+    __slots__ = ("first", "last", "pay")
+    
     raise_amount = 1.04  # Class variable
     num_employees = 0
     
@@ -24,6 +24,8 @@ from abc import ABC, abstractmethod
 class LibraryItem(ABC):
     """Abstract base class for all library items."""
     
+    __slots__ = ("_item_id", "_title", "_author", "_is_available", "_borrowed_by", "_due_date")
+    
     def __init__(self, item_id: str, title: str, author: str):
         self._item_id = item_id
         self._title = title
@@ -88,6 +90,8 @@ class LibraryItem(ABC):
 class Book(LibraryItem):
     """Book class - specific type of library item."""
     
+    __slots__ = ("isbn", "genre")
+    
     def __init__(self, item_id: str, title: str, author: str, isbn: str, genre: str):
         super().__init__(item_id, title, author)
         self.isbn = isbn
@@ -115,6 +119,8 @@ Status:   {status}
 class Magazine(LibraryItem):
     """Magazine class - different borrowing rules."""
     
+    __slots__ = ("issue",)
+    
     def __init__(self, item_id: str, title: str, publisher: str, issue: str):
         super().__init__(item_id, title, publisher)
         self.issue = issue
@@ -144,6 +150,8 @@ Status:    {status}
 class Member(ABC):
     """Abstract base class for library members."""
     
+    __slots__ = ("_member_id", "_name", "_email", "_borrowed_items", "_total_fines", "_registration_date")
+    
     def __init__(self, member_id: str, name: str, email: str):
         self._member_id = member_id
         self._name = name
@@ -209,6 +217,8 @@ class Member(ABC):
 class StudentMember(Member):
     """Student member with limited borrowing privileges."""
     
+    __slots__ = ("student_id",)
+    
     def __init__(self, member_id: str, name: str, email: str, student_id: str):
         super().__init__(member_id, name, email)
         self.student_id = student_id
@@ -223,6 +233,8 @@ class StudentMember(Member):
 class FacultyMember(Member):
     """Faculty member with extended privileges."""
     
+    __slots__ = ("department",)
+    
     def __init__(self, member_id: str, name: str, email: str, department: str):
         super().__init__(member_id, name, email)
         self.department = department
@@ -237,6 +249,8 @@ class FacultyMember(Member):
 class RegularMember(Member):
     """Regular member with standard privileges."""
     
+    __slots__ = ()
+    
     def get_borrow_limit(self) -> int:
         return 5  # Regular members can borrow up to 5 items
     